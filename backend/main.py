@@ -1,6 +1,5 @@
 from pathlib import Path
 
-import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -8,6 +7,7 @@ from fastapi.staticfiles import StaticFiles
 from src.core.config import get_settings
 from src.core.logging_config import setup_logging
 from src.presentation.middleware.error_handler import add_exception_handlers
+from src.presentation.responses import ORJSONResponse
 from src.presentation.routes import batch_execution, execution, experiments, graphs, nodes
 
 
@@ -19,6 +19,7 @@ def create_app() -> FastAPI:
         title="Pixel-Groove API",
         version="0.1.0",
         description="Graph execution engine for AI media generation",
+        default_response_class=ORJSONResponse,
     )
 
     app.add_middleware(
@@ -51,5 +52,7 @@ def create_app() -> FastAPI:
 app = create_app()
 
 if __name__ == "__main__":
+    import uvicorn
+
     settings = get_settings()
     uvicorn.run("main:app", host=settings.HOST, port=settings.PORT, reload=True)
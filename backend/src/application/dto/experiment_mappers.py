@@ -1,4 +1,9 @@
-"""Centralized experiment domain-model → DTO mapping functions."""
+"""Centralized experiment domain-model → DTO mapping functions.
+
+As in ``mappers``, DTOs are built with ``model_construct`` from trusted
+domain models; every field is passed explicitly. ``genome_label`` dicts are
+handed over by reference: nothing validates or copies them on the way out.
+"""
 
 from ...domain.models.experiment import ContentGenome, Experiment, GenomeDimension, Hook, RequiredAsset
 from .experiment_responses import (
@@ -11,7 +16,7 @@ from .experiment_responses import (
 
 
 def genome_dimension_to_dto(d: GenomeDimension) -> GenomeDimensionDTO:
-    return GenomeDimensionDTO(
+    return GenomeDimensionDTO.model_construct(
         name=d.name,
         values=d.values,
         description=d.description,
@@ -19,11 +24,11 @@ def genome_dimension_to_dto(d: GenomeDimension) -> GenomeDimensionDTO:
 
 
 def required_asset_to_dto(a: RequiredAsset) -> RequiredAssetDTO:
-    return RequiredAssetDTO(name=a.name, description=a.description)
+    return RequiredAssetDTO.model_construct(name=a.name, description=a.description)
 
 
 def genome_to_dto(g: ContentGenome) -> ContentGenomeDTO:
-    return ContentGenomeDTO(
+    return ContentGenomeDTO.model_construct(
         dimensions=[genome_dimension_to_dto(d) for d in g.dimensions],
         brief=g.brief,
         goal=g.goal,
@@ -37,21 +42,21 @@ def genome_to_dto(g: ContentGenome) -> ContentGenomeDTO:
 
 
 def hook_to_dto(h: Hook) -> HookDTO:
-    return HookDTO(
+    return HookDTO.model_construct(
         id=h.id,
         graph_id=h.graph_id,
         genome_label=h.genome_label,
-        status=h.status.value,
+        status=h.status,
         label=h.label,
     )
 
 
 def experiment_to_dto(e: Experiment) -> ExperimentDTO:
-    return ExperimentDTO(
+    return ExperimentDTO.model_construct(
         id=e.id,
         name=e.name,
         brief=e.brief,
-        status=e.status.value,
+        status=e.status,
         genome=genome_to_dto(e.genome) if e.genome else None,
         hooks=[hook_to_dto(h) for h in e.hooks],
         created_at=e.created_at,
@@ -36,3 +36,7 @@ class BuildHooksRequest(BaseModel):
 
 class UpdateHookStatusRequest(BaseModel):
     status: str
+
+
+class UpdateHookStatusesRequest(BaseModel):
+    changes: Dict[str, str]  # hook_id -> status
@@ -1,20 +1,21 @@
-from pydantic import BaseModel
-from typing import Dict, List, Optional
+from typing import Optional
 
+from .responses import ResponseDTO
 
-class GenomeDimensionDTO(BaseModel):
+
+class GenomeDimensionDTO(ResponseDTO):
     name: str
-    values: List[str]
+    values: list[str]
     description: str = ""
 
 
-class RequiredAssetDTO(BaseModel):
+class RequiredAssetDTO(ResponseDTO):
     name: str
     description: str = ""
 
 
-class ContentGenomeDTO(BaseModel):
-    dimensions: List[GenomeDimensionDTO]
+class ContentGenomeDTO(ResponseDTO):
+    dimensions: list[GenomeDimensionDTO]
     brief: str
     goal: str = ""
     target_audience: str = ""
@@ -22,24 +23,24 @@ class ContentGenomeDTO(BaseModel):
     desired_outcome: str = ""
     reference_image_url: str = ""
     reference_image_usage: str = ""
-    required_assets: List[RequiredAssetDTO] = []
+    required_assets: list[RequiredAssetDTO] = []
 
 
-class HookDTO(BaseModel):
+class HookDTO(ResponseDTO):
     id: str
     graph_id: str
-    genome_label: Dict[str, str]
+    genome_label: dict[str, str]
     status: str
     label: str = ""
 
 
-class ExperimentDTO(BaseModel):
+class ExperimentDTO(ResponseDTO):
     id: str
     name: str
     brief: str
     status: str
     genome: Optional[ContentGenomeDTO] = None
-    hooks: List[HookDTO] = []
+    hooks: list[HookDTO] = []
     created_at: float = 0
     updated_at: float = 0
     artifact_type: str = "video"
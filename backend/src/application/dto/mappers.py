@@ -1,7 +1,16 @@
-"""Centralized domain-model → DTO mapping functions."""
+"""Centralized domain-model → DTO mapping functions.
+
+DTOs are built with ``model_construct``: the input is a vetted domain model,
+so re-running pydantic validation on every response would be pure overhead.
+Every field must therefore be passed explicitly. Domain enums are StrEnums,
+so they are handed to the DTOs as-is without a ``.value`` lookup.
+"""
+
+from functools import lru_cache
 
 from ...domain.models.graph import Edge, Graph, Node
 from ...domain.models.media import MediaResult
+from ...domain.models.ports import Port
 from .responses import (
     EdgeDTO,
     GraphDTO,
@@ -13,29 +22,35 @@ from .responses import (
 )
 
 
+@lru_cache(maxsize=4096)
+def _cached_port_dto(
+    port_id: str, name: str, port_type: str, direction: str, required: bool, description: str,
+) -> PortDTO:
+    return PortDTO.model_construct(
+        id=port_id, name=name, port_type=port_type,
+        direction=direction, required=required, description=description,
+    )
+
+
+def port_to_dto(p: Port) -> PortDTO:
+    # Ports never change after node creation, so identical ports are served
+    # from a value-keyed cache instead of being rebuilt on every GET.
+    return _cached_port_dto(
+        p.id, p.name, p.port_type, p.direction, p.required, p.description,
+    )
+
+
 def node_to_dto(node: Node) -> NodeDTO:
-    return NodeDTO(
+    return NodeDTO.model_construct(
         id=node.id,
-        type=node.type.value,
+        type=node.type,
         label=node.label,
         params=node.params,
         position={"x": node.position.x, "y": node.position.y},
         provider=node.provider,
-        status=node.status.value,
-        input_ports=[
-            PortDTO(
-                id=p.id, name=p.name, port_type=p.port_type.value,
-                direction=p.direction.value, required=p.required, description=p.description,
-            )
-            for p in node.input_ports
-        ],
-        output_ports=[
-            PortDTO(
-                id=p.id, name=p.name, port_type=p.port_type.value,
-                direction=p.direction.value, required=p.required, description=p.description,
-            )
-            for p in node.output_ports
-        ],
+        status=node.status,
+        input_ports=[port_to_dto(p) for p in node.input_ports],
+        output_ports=[port_to_dto(p) for p in node.output_ports],
         result=media_to_dto(node.result) if node.result else None,
         error_message=node.error_message,
         stale=node.stale,
@@ -43,13 +58,13 @@ def node_to_dto(node: Node) -> NodeDTO:
 
 
 def media_to_dto(m: MediaResult) -> MediaResultDTO:
-    return MediaResultDTO(
+    return MediaResultDTO.model_construct(
         id=m.id,
         timestamp=m.timestamp,
-        media_type=m.media_type.value,
-        urls=MediaUrlsDTO(original=m.urls.original, thumbnail=m.urls.thumbnail),
+        media_type=m.media_type,
+        urls=MediaUrlsDTO.model_construct(original=m.urls.original, thumbnail=m.urls.thumbnail),
         prompt=m.prompt,
-        metadata=MediaMetadataDTO(
+        metadata=MediaMetadataDTO.model_construct(
             width=m.metadata.width, height=m.metadata.height,
             duration=m.metadata.duration, format=m.metadata.format,
             size_bytes=m.metadata.size_bytes,
@@ -60,7 +75,7 @@ def media_to_dto(m: MediaResult) -> MediaResultDTO:
 
 
 def edge_to_dto(edge: Edge) -> EdgeDTO:
-    return EdgeDTO(
+    return EdgeDTO.model_construct(
         id=edge.id,
         from_node_id=edge.connection.from_node_id,
         from_port_id=edge.connection.from_port_id,
@@ -70,7 +85,7 @@ def edge_to_dto(edge: Edge) -> EdgeDTO:
 
 
 def graph_to_dto(graph: Graph) -> GraphDTO:
-    return GraphDTO(
+    return GraphDTO.model_construct(
         id=graph.id,
         name=graph.name,
         canvas_memory=graph.canvas_memory,
@@ -1,8 +1,13 @@
-from pydantic import BaseModel
-from typing import Dict, List, Optional
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
 
 
-class PortDTO(BaseModel):
+class ResponseDTO(BaseModel):
+    """Base for outbound DTOs: immutable, unknown fields ignored."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class PortDTO(ResponseDTO):
     id: str
     name: str
     port_type: str
@@ -11,12 +16,12 @@ class PortDTO(BaseModel):
     description: str
 
 
-class MediaUrlsDTO(BaseModel):
+class MediaUrlsDTO(ResponseDTO):
     original: str
     thumbnail: str
 
 
-class MediaMetadataDTO(BaseModel):
+class MediaMetadataDTO(ResponseDTO):
     width: Optional[int] = None
     height: Optional[int] = None
     duration: Optional[float] = None
@@ -24,33 +29,33 @@ class MediaMetadataDTO(BaseModel):
     size_bytes: Optional[int] = None
 
 
-class MediaResultDTO(BaseModel):
+class MediaResultDTO(ResponseDTO):
     id: str
     timestamp: int
     media_type: str
     urls: MediaUrlsDTO
     prompt: str
     metadata: MediaMetadataDTO
-    generation_params: Dict
+    generation_params: dict
     original_prompt: Optional[str] = None
 
 
-class NodeDTO(BaseModel):
+class NodeDTO(ResponseDTO):
     id: str
     type: str
     label: str
-    params: Dict
-    position: Dict[str, float]
+    params: dict
+    position: dict[str, float]
     provider: str
     status: str
-    input_ports: List[PortDTO]
-    output_ports: List[PortDTO]
+    input_ports: list[PortDTO]
+    output_ports: list[PortDTO]
     result: Optional[MediaResultDTO] = None
     error_message: Optional[str] = None
     stale: bool = False
 
 
-class EdgeDTO(BaseModel):
+class EdgeDTO(ResponseDTO):
     id: str
     from_node_id: str
     from_port_id: str
@@ -58,16 +63,16 @@ class EdgeDTO(BaseModel):
     to_port_id: str
 
 
-class GraphDTO(BaseModel):
+class GraphDTO(ResponseDTO):
     id: str
     name: str
     canvas_memory: str = ""
     created_at: float = 0
     updated_at: float = 0
-    nodes: List[NodeDTO]
-    edges: List[EdgeDTO]
+    nodes: list[NodeDTO]
+    edges: list[EdgeDTO]
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(ResponseDTO):
     error: str
     details: Optional[str] = None
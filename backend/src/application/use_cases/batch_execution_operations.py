@@ -2,11 +2,13 @@
 
 import asyncio
 import logging
-from typing import AsyncGenerator, Dict, List
+from typing import AsyncGenerator, Dict, List, Set
 
+from ...core.utils.event_channel import EventChannel
 from ...core.utils.id_generator import generate_id
 from ...domain.models.batch_execution import (
     BatchContext,
+    BatchEvent,
     GraphOutcome,
     SchedulableNode,
 )
@@ -31,7 +33,7 @@ class BatchExecutionOperations:
         self._graph_repo = graph_repo
         self._memory = memory
         self._contexts: Dict[str, BatchContext] = {}
-        self._queues: Dict[str, asyncio.Queue] = {}
+        self._channels: Dict[str, EventChannel[BatchEvent]] = {}
 
     async def start_batch(
         self,
@@ -61,12 +63,13 @@ class BatchExecutionOperations:
         for gid, graph in graphs.items():
             all_node_ids = list(graph.nodes.keys())
             required = get_required_nodes(graph, all_node_ids)
+            dependency_index = graph.dependency_index()
 
             for node_id in required:
                 node = graph.get_node(node_id)
                 if not node:
                     continue
-                deps = set(graph.get_dependencies(node_id)) & required
+                deps = set(dependency_index.get(node_id, ())) & required
                 schedulable_nodes.append(SchedulableNode(
                     node_id=node_id,
                     graph_id=gid,
@@ -85,7 +88,7 @@ class BatchExecutionOperations:
             graph_outcomes={gid: GraphOutcome.PENDING for gid in graph_ids},
         )
         self._contexts[batch_id] = context
-        self._queues[batch_id] = asyncio.Queue()
+        self._channels[batch_id] = EventChannel()
 
         asyncio.create_task(self._run(schedulable_nodes, graphs, context))
         return batch_id
@@ -96,53 +99,53 @@ class BatchExecutionOperations:
         graphs: Dict,
         context: BatchContext,
     ) -> None:
-        queue = self._queues[context.batch_id]
+        channel = self._channels[context.batch_id]
+        # Graphs touched since their last save; only these are written again
+        dirty: Set[str] = set()
         try:
             async for event in self._scheduler.execute(nodes, context):
-                await queue.put({
-                    "batch_id": event.batch_id,
-                    "event_type": event.event_type,
-                    "timestamp": event.timestamp,
-                    "graph_id": event.graph_id,
-                    "node_id": event.node_id,
-                    "data": event.data,
-                })
+                # Scheduler events go through as-is; sse_stream serializes them
+                channel.push(event)
+                if event.graph_id is None:
+                    continue
+                dirty.add(event.graph_id)
 
                 # Save graph state when a graph completes or fails
                 if event.event_type in ("graph_completed", "graph_failed"):
                     graph = graphs.get(event.graph_id)
                     if graph:
                         await self._graph_repo.save(graph)
+                        dirty.discard(event.graph_id)
 
         except Exception as e:
             logger.error("Batch %s crashed: %s", context.batch_id, e)
-            await queue.put({
-                "batch_id": context.batch_id,
-                "event_type": "batch_failed",
-                "timestamp": 0,
-                "data": {"error": str(e)},
-            })
+            # Node state may have changed without an event reaching us
+            dirty.update(graphs)
+            channel.push(BatchEvent(
+                batch_id=context.batch_id,
+                event_type="batch_failed",
+                timestamp=0,
+                data={"error": str(e)},
+            ))
         finally:
-            # Save any remaining graphs
-            for graph in graphs.values():
+            # Save graphs with unsaved changes
+            for gid in dirty:
+                graph = graphs[gid]
                 try:
                     await self._graph_repo.save(graph)
                 except Exception:
                     logger.error("Failed to save graph %s after batch", graph.id)
-            await queue.put(None)  # sentinel
+            channel.close()
 
-    async def stream_batch(self, batch_id: str) -> AsyncGenerator[Dict, None]:
-        queue = self._queues.get(batch_id)
-        if not queue:
+    async def stream_batch(self, batch_id: str) -> AsyncGenerator[BatchEvent, None]:
+        channel = self._channels.get(batch_id)
+        if not channel:
             raise ValueError(f"No batch execution found: {batch_id}")
 
-        while True:
-            event = await queue.get()
-            if event is None:
-                break
+        async for event in channel:
             yield event
 
-        self._queues.pop(batch_id, None)
+        self._channels.pop(batch_id, None)
         self._contexts.pop(batch_id, None)
 
     async def cancel_batch(self, batch_id: str) -> None:
@@ -3,8 +3,9 @@ import logging
 from typing import AsyncGenerator, Dict
 
 from ...core.exceptions import ExecutionError
+from ...core.utils.event_channel import EventChannel
 from ...core.utils.id_generator import generate_id
-from ...domain.models.execution import ExecutionContext, ExecutionStatus
+from ...domain.models.execution import ExecutionContext, ExecutionEvent, ExecutionStatus
 from ...domain.ports import CanvasMemoryPort, GraphRepositoryPort
 from ...domain.services.graph_executor import GraphExecutor
 from ._helpers import get_graph_or_raise
@@ -26,7 +27,7 @@ class ExecutionOperations:
         self._memory = memory
         # Active executions keyed by execution_id
         self._contexts: Dict[str, ExecutionContext] = {}
-        self._queues: Dict[str, asyncio.Queue] = {}
+        self._channels: Dict[str, EventChannel[ExecutionEvent]] = {}
 
     async def start_execution(self, graph_id: str, output_node_ids: list[str], force: bool = False) -> str:
         graph = await get_graph_or_raise(self._repo, graph_id)
@@ -39,52 +40,43 @@ class ExecutionOperations:
             force=force,
         )
         self._contexts[execution_id] = context
-        self._queues[execution_id] = asyncio.Queue()
+        self._channels[execution_id] = EventChannel()
 
-        # Run execution in background, push events to the queue
+        # Run execution in background, push events to the channel
         asyncio.create_task(self._run(graph, context))
         return execution_id
 
     async def _run(self, graph, context: ExecutionContext) -> None:
-        queue = self._queues[context.execution_id]
+        channel = self._channels[context.execution_id]
         try:
             # Resolve canvas memory once before execution starts
             canvas_memory = await self._memory.resolve(graph)
             async for event in self._executor.execute(graph, context, canvas_memory):
-                await queue.put({
-                    "execution_id": event.execution_id,
-                    "event_type": event.event_type,
-                    "timestamp": event.timestamp,
-                    "node_id": event.node_id,
-                    "data": event.data,
-                })
+                channel.push(event)
             # Save graph state after execution (nodes now have results)
             await self._repo.save(graph)
         except Exception as e:
             logger.error("Execution %s crashed: %s", context.execution_id, e)
-            await queue.put({
-                "execution_id": context.execution_id,
-                "event_type": "failed",
-                "timestamp": 0,
-                "data": {"error": str(e)},
-            })
+            channel.push(ExecutionEvent(
+                execution_id=context.execution_id,
+                event_type="failed",
+                timestamp=0,
+                data={"error": str(e)},
+            ))
         finally:
             # Sentinel to signal stream end
-            await queue.put(None)
+            channel.close()
 
-    async def stream_execution(self, execution_id: str) -> AsyncGenerator[Dict, None]:
-        queue = self._queues.get(execution_id)
-        if not queue:
+    async def stream_execution(self, execution_id: str) -> AsyncGenerator[ExecutionEvent, None]:
+        channel = self._channels.get(execution_id)
+        if not channel:
             raise ExecutionError(f"No execution found: {execution_id}")
 
-        while True:
-            event = await queue.get()
-            if event is None:
-                break
+        async for event in channel:
             yield event
 
         # Cleanup
-        self._queues.pop(execution_id, None)
+        self._channels.pop(execution_id, None)
         self._contexts.pop(execution_id, None)
 
     async def cancel_execution(self, execution_id: str) -> None:
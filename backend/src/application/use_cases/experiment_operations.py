@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import List
+from collections import OrderedDict
+from typing import Dict, List, Optional
 
 from ...core.exceptions import ExperimentNotFoundError
 from ...core.utils.id_generator import generate_id
@@ -18,6 +19,14 @@ from ...domain.services.experiment_service import ExperimentService
 
 logger = logging.getLogger(__name__)
 
+# Reference images kept in memory across rebuilds, bounded by count and total size
+_REF_CACHE_MAX_ENTRIES = 8
+_REF_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Hook statuses moved by select-all / deselect-all
+_SELECTABLE = frozenset({HookStatus.DRAFT, HookStatus.EXECUTED})
+_DESELECTABLE = frozenset({HookStatus.SELECTED, HookStatus.EXECUTED})
+
 
 class ExperimentOperations:
     def __init__(
@@ -32,6 +41,8 @@ class ExperimentOperations:
         self._storage = storage
         self._experiment_service = experiment_service
         self._build_tasks: dict[str, asyncio.Task] = {}
+        self._ref_bytes_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._ref_bytes_total = 0
 
     async def create_experiment(self, name: str, brief: str) -> Experiment:
         experiment = Experiment(
@@ -104,67 +115,112 @@ class ExperimentOperations:
         images_per_hook: int = -1,
     ) -> Experiment:
         experiment = await self.get_experiment(experiment_id)
+        updates = {}
         if artifact_type is not None:
-            experiment.artifact_type = artifact_type
+            updates["artifact_type"] = artifact_type
         if image_model is not None:
-            experiment.image_model = image_model
+            updates["image_model"] = image_model
         if video_model is not None:
-            experiment.video_model = video_model
+            updates["video_model"] = video_model
         if images_per_hook != -1:
-            experiment.images_per_hook = images_per_hook if images_per_hook > 0 else None
-        await self._experiment_repo.save(experiment)
+            updates["images_per_hook"] = images_per_hook if images_per_hook > 0 else None
+
+        changed = False
+        for name, value in updates.items():
+            if getattr(experiment, name) != value:
+                setattr(experiment, name, value)
+                changed = True
+
+        # Unchanged form submits are common; skip the file rewrite for them
+        if changed:
+            await self._experiment_repo.save(experiment)
         return experiment
 
     async def build_hooks(self, experiment_id: str, count: int = 4) -> Experiment:
-        self._build_tasks[experiment_id] = asyncio.current_task()
-        try:
-            experiment = await self.get_experiment(experiment_id)
-
-            if not experiment.genome:
-                raise ValueError("Experiment must have a genome before building hooks")
-
-            reference_image_bytes = None
-            if experiment.genome.reference_image_url:
-                reference_image_bytes = await self._storage.read_media_bytes(
-                    experiment.genome.reference_image_url
-                )
-
-            logger.info("Generating %d %s hook graphs for experiment %s", count, experiment.artifact_type, experiment_id)
-            results = await self._experiment_service.generate_hook_graphs(
-                genome=experiment.genome,
-                experiment_name=experiment.name,
-                count=count,
-                artifact_type=experiment.artifact_type,
-                image_model=experiment.image_model,
-                video_model=experiment.video_model,
-                reference_image_bytes=reference_image_bytes,
-                images_per_hook=experiment.images_per_hook,
+        """Run the build in its own task so cancel_build can stop it cleanly.
+
+        Raises CancelledError in the caller if the build is cancelled.
+        """
+        task = asyncio.create_task(self._do_build_hooks(experiment_id, count))
+        self._build_tasks[experiment_id] = task
+        task.add_done_callback(lambda t: self._forget_build_task(experiment_id, t))
+        return await asyncio.shield(task)
+
+    async def _read_reference_image(self, url: str) -> Optional[bytes]:
+        """Read reference image bytes, reusing them across rebuilds.
+
+        Uploaded reference images get a fresh URL each time, so a URL-keyed
+        entry never goes stale.
+        """
+        data = self._ref_bytes_cache.get(url)
+        if data is not None:
+            self._ref_bytes_cache.move_to_end(url)
+            return data
+
+        data = await self._storage.read_media_bytes(url)
+        if data is None or len(data) > _REF_CACHE_MAX_BYTES:
+            return data
+
+        self._ref_bytes_cache[url] = data
+        self._ref_bytes_total += len(data)
+        while (
+            len(self._ref_bytes_cache) > _REF_CACHE_MAX_ENTRIES
+            or self._ref_bytes_total > _REF_CACHE_MAX_BYTES
+        ):
+            _, evicted = self._ref_bytes_cache.popitem(last=False)
+            self._ref_bytes_total -= len(evicted)
+        return data
+
+    def _forget_build_task(self, experiment_id: str, task: asyncio.Task) -> None:
+        # A newer build for the same experiment may have replaced this entry
+        if self._build_tasks.get(experiment_id) is task:
+            del self._build_tasks[experiment_id]
+
+    async def _do_build_hooks(self, experiment_id: str, count: int) -> Experiment:
+        experiment = await self.get_experiment(experiment_id)
+
+        if not experiment.genome:
+            raise ValueError("Experiment must have a genome before building hooks")
+
+        reference_image_bytes = None
+        if experiment.genome.reference_image_url:
+            reference_image_bytes = await self._read_reference_image(
+                experiment.genome.reference_image_url
             )
-            logger.info("Got %d hook graphs", len(results))
-
-            hooks = []
-            for graph, genome_label in results:
-                graph.experiment_id = experiment.id
-                await self._graph_repo.save(graph)
-
-                hook = Hook(
-                    id=generate_id(),
-                    graph_id=graph.id,
-                    genome_label=genome_label,
-                    status=HookStatus.DRAFT,
-                    label=graph.name,
-                )
-                hooks.append(hook)
-
-            experiment.hooks = hooks
-            experiment.status = ExperimentStatus.BUILT
-            await self._experiment_repo.save(experiment)
-            return experiment
-        except asyncio.CancelledError:
-            self._build_tasks.pop(experiment_id, None)
-            raise
-        finally:
-            self._build_tasks.pop(experiment_id, None)
+
+        logger.info("Generating %d %s hook graphs for experiment %s", count, experiment.artifact_type, experiment_id)
+        results = await self._experiment_service.generate_hook_graphs(
+            genome=experiment.genome,
+            experiment_name=experiment.name,
+            count=count,
+            artifact_type=experiment.artifact_type,
+            image_model=experiment.image_model,
+            video_model=experiment.video_model,
+            reference_image_bytes=reference_image_bytes,
+            images_per_hook=experiment.images_per_hook,
+        )
+        logger.info("Got %d hook graphs", len(results))
+
+        hooks = []
+        graphs = []
+        for graph, genome_label in results:
+            graph.experiment_id = experiment.id
+            graphs.append(graph)
+
+            hook = Hook(
+                id=generate_id(),
+                graph_id=graph.id,
+                genome_label=genome_label,
+                status=HookStatus.DRAFT,
+                label=graph.name,
+            )
+            hooks.append(hook)
+
+        await self._graph_repo.save_many(graphs)
+        experiment.hooks = hooks
+        experiment.status = ExperimentStatus.BUILT
+        await self._experiment_repo.save(experiment)
+        return experiment
 
     async def update_hook_status(
         self,
@@ -172,39 +228,56 @@ class ExperimentOperations:
         hook_id: str,
         status: str,
     ) -> Experiment:
+        return await self.update_hook_statuses(experiment_id, {hook_id: status})
+
+    async def update_hook_statuses(
+        self,
+        experiment_id: str,
+        changes: Dict[str, str],
+    ) -> Experiment:
+        """Apply several hook status changes with a single load and save."""
         experiment = await self.get_experiment(experiment_id)
 
-        hook = next((h for h in experiment.hooks if h.id == hook_id), None)
-        if not hook:
-            raise ValueError(f"Hook {hook_id} not found")
+        by_id = {h.id: h for h in experiment.hooks}
+        updates = []
+        for hook_id, status in changes.items():
+            hook = by_id.get(hook_id)
+            if not hook:
+                raise ValueError(f"Hook {hook_id} not found")
+            updates.append((hook, HookStatus(status)))
 
-        hook.status = HookStatus(status)
+        for hook, status in updates:
+            hook.status = status
         await self._experiment_repo.save(experiment)
         return experiment
 
     async def select_all_hooks(self, experiment_id: str) -> Experiment:
-        experiment = await self.get_experiment(experiment_id)
-
-        for hook in experiment.hooks:
-            if hook.status in (HookStatus.DRAFT, HookStatus.EXECUTED):
-                hook.status = HookStatus.SELECTED
-
-        await self._experiment_repo.save(experiment)
-        return experiment
+        return await self._set_all_hooks(experiment_id, _SELECTABLE, HookStatus.SELECTED)
 
     async def deselect_all_hooks(self, experiment_id: str) -> Experiment:
+        return await self._set_all_hooks(experiment_id, _DESELECTABLE, HookStatus.DRAFT)
+
+    async def _set_all_hooks(
+        self, experiment_id: str, from_statuses: frozenset, to_status: HookStatus,
+    ) -> Experiment:
         experiment = await self.get_experiment(experiment_id)
 
+        changed = False
         for hook in experiment.hooks:
-            if hook.status in (HookStatus.SELECTED, HookStatus.EXECUTED):
-                hook.status = HookStatus.DRAFT
+            if hook.status in from_statuses:
+                hook.status = to_status
+                changed = True
 
-        await self._experiment_repo.save(experiment)
+        # Skip the file rewrite when every hook was already in place
+        if changed:
+            await self._experiment_repo.save(experiment)
         return experiment
 
     async def delete_experiment(self, experiment_id: str) -> None:
         experiment = await self.get_experiment(experiment_id)
 
+        # Sequential on purpose: storage and repository calls do their file I/O
+        # synchronously, so gathering them would not overlap anything
         for hook in experiment.hooks:
             graph = await self._graph_repo.load(hook.graph_id)
             if graph:
@@ -1,18 +1,47 @@
 """Graph-level CRUD operations (create, read, update, delete, duplicate)."""
 
-import copy
+import dataclasses
 import logging
 from typing import Dict, List
 
 from ...core.exceptions import GraphNotFoundError
-from ...core.utils.id_generator import generate_id
-from ...domain.models.graph import Edge, Graph, Node, Position
+from ...core.utils.id_generator import generate_id, generate_ids
+from ...domain.models.graph import Edge, Graph, Node
 from ...domain.models.media import MediaUrls
+from ...domain.models.ports import Port
 from ...domain.ports import GraphRepositoryPort, StoragePort
 
 logger = logging.getLogger(__name__)
 
 
+def _copy_port(p: Port, old_id: str, new_id: str, port_id_map: Dict[str, str]) -> Port:
+    new_port_id = p.id.replace(old_id, new_id, 1)
+    port_id_map[p.id] = new_port_id
+    return dataclasses.replace(p, id=new_port_id)
+
+
+def _remap_url(url: str, old_prefix: str, new_prefix: str) -> str:
+    """Point a node's local media URL at the copied node's directory."""
+    if url.startswith(old_prefix):
+        return new_prefix + url[len(old_prefix):]
+    return url
+
+
+def _remap_media_urls(urls: MediaUrls, old_prefix: str, new_prefix: str) -> MediaUrls:
+    return MediaUrls(
+        original=_remap_url(urls.original, old_prefix, new_prefix),
+        thumbnail=_remap_url(urls.thumbnail, old_prefix, new_prefix),
+    )
+
+
+def _copy_params(params: Dict) -> Dict:
+    """Copy a params dict one level deep; nested lists/dicts get their own container."""
+    return {
+        k: list(v) if isinstance(v, list) else dict(v) if isinstance(v, dict) else v
+        for k, v in params.items()
+    }
+
+
 class GraphOperations:
     """CRUD operations for graphs."""
 
@@ -54,51 +83,38 @@ class GraphOperations:
         """Deep-copy a graph: new IDs for graph/nodes/edges, copy media files."""
         source = await self.get_graph(graph_id)
 
-        new_graph_id = generate_id()
+        new_graph_id, *new_node_ids = generate_ids(len(source.nodes) + 1)
         # Build old_node_id -> new_node_id mapping
-        node_id_map: Dict[str, str] = {}
-        for old_id in source.nodes:
-            node_id_map[old_id] = generate_id()
+        node_id_map: Dict[str, str] = dict(zip(source.nodes, new_node_ids))
 
-        # Deep-copy nodes with new IDs and remapped port IDs
+        # Copy nodes with new IDs and remapped port IDs. Ports, media metadata
+        # and positions are built fresh or immutable, so no deepcopy is needed.
         new_nodes: Dict[str, Node] = {}
+        port_id_map: Dict[str, str] = {}
         for old_id, old_node in source.nodes.items():
             new_id = node_id_map[old_id]
 
             # Remap port IDs (they embed the node ID)
-            new_input_ports = []
-            for p in old_node.input_ports:
-                new_p = copy.deepcopy(p)
-                new_p.id = p.id.replace(old_id, new_id, 1)
-                new_input_ports.append(new_p)
-
-            new_output_ports = []
-            for p in old_node.output_ports:
-                new_p = copy.deepcopy(p)
-                new_p.id = p.id.replace(old_id, new_id, 1)
-                new_output_ports.append(new_p)
-
-            # Copy media files and remap URLs in results
-            def _remap_media_urls(urls: MediaUrls) -> MediaUrls:
-                return MediaUrls(
-                    original=urls.original.replace(f"/media/{old_id}/", f"/media/{new_id}/") if urls.original.startswith("/media/") else urls.original,
-                    thumbnail=urls.thumbnail.replace(f"/media/{old_id}/", f"/media/{new_id}/") if urls.thumbnail.startswith("/media/") else urls.thumbnail,
-                )
+            new_input_ports = [_copy_port(p, old_id, new_id, port_id_map) for p in old_node.input_ports]
+            new_output_ports = [_copy_port(p, old_id, new_id, port_id_map) for p in old_node.output_ports]
 
+            # Remap URLs in results to the copied media files
             new_result = None
             if old_node.result:
-                new_result = copy.deepcopy(old_node.result)
-                new_result.urls = _remap_media_urls(new_result.urls)
-
-            # Copy media files via storage port
-            await self._storage.duplicate_node_media(old_id, new_id)
+                new_result = dataclasses.replace(
+                    old_node.result,
+                    urls=_remap_media_urls(
+                        old_node.result.urls, f"/media/{old_id}/", f"/media/{new_id}/",
+                    ),
+                    generation_params=_copy_params(old_node.result.generation_params),
+                )
 
             new_node = Node(
                 id=new_id,
                 type=old_node.type,
                 label=old_node.label,
-                params=copy.deepcopy(old_node.params),
-                position=Position(x=old_node.position.x, y=old_node.position.y),
+                params=_copy_params(old_node.params),
+                position=old_node.position,
                 provider=old_node.provider,
                 status=old_node.status,
                 input_ports=new_input_ports,
@@ -109,16 +125,7 @@ class GraphOperations:
             )
             new_nodes[new_id] = new_node
 
-        # Build port ID mapping for edges
-        port_id_map: Dict[str, str] = {}
-        for old_id, new_id in node_id_map.items():
-            source_node = source.nodes[old_id]
-            for p in source_node.input_ports:
-                port_id_map[p.id] = p.id.replace(old_id, new_id, 1)
-            for p in source_node.output_ports:
-                port_id_map[p.id] = p.id.replace(old_id, new_id, 1)
-
-        # Deep-copy edges with remapped IDs
+        # Rebuild edges with remapped IDs
         new_edges: List[Edge] = []
         for old_edge in source.edges:
             c = old_edge.connection
@@ -130,6 +137,11 @@ class GraphOperations:
             )
             new_edges.append(new_edge)
 
+        # Copy media files via storage port (each copy is a blocking copytree,
+        # so there is nothing to gain from gathering them)
+        for old_id, new_id in node_id_map.items():
+            await self._storage.duplicate_node_media(old_id, new_id)
+
         new_graph = Graph(
             id=new_graph_id,
             name=f"{source.name} (Copy)",
@@ -1,11 +1,15 @@
+import json
+import os
+from dataclasses import dataclass, field, fields
 from functools import lru_cache
 
-from pydantic_settings import BaseSettings
+from dotenv import dotenv_values
 
 from ..domain.models.enums import AudioModel, ImageModel, TextModel, VideoModel
 
 
-class Settings(BaseSettings):
+@dataclass(frozen=True, slots=True)
+class Settings:
     GEMINI_API_KEY: str = ""
 
     STORAGE_PATH: str = "./storage"
@@ -14,7 +18,9 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
 
-    CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:5173"]
+    CORS_ORIGINS: list[str] = field(
+        default_factory=lambda: ["http://localhost:3000", "http://localhost:5173"]
+    )
 
     LOG_LEVEL: str = "INFO"
 
@@ -32,11 +38,52 @@ class Settings(BaseSettings):
 
     ENRICHMENT_ENABLED: bool = True
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
 
+# Same spellings pydantic accepts for bool fields
+_TRUE_VALUES = frozenset({"1", "on", "t", "true", "y", "yes"})
+_FALSE_VALUES = frozenset({"0", "off", "f", "false", "n", "no"})
 
-@lru_cache()
+
+def _parse_bool(raw: str) -> bool:
+    value = raw.strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {raw!r}")
+
+
+def _parse_list(raw: str) -> list[str]:
+    # JSON array (the format pydantic-settings required) or comma-separated values
+    raw = raw.strip()
+    if raw.startswith("["):
+        return [str(v) for v in json.loads(raw)]
+    return [v.strip() for v in raw.split(",") if v.strip()]
+
+
+_PARSERS = {int: int, bool: _parse_bool, list[str]: _parse_list}
+
+
+def _load_settings(env_file: str = ".env") -> Settings:
+    """Build Settings from the environment; .env fills in anything not already set.
+
+    Names match case-insensitively, and the .env file is read without being
+    copied into os.environ.
+    """
+    dotenv = dotenv_values(env_file, encoding="utf-8")
+    values = {k.upper(): v for k, v in dotenv.items() if v is not None}
+    values.update((k.upper(), v) for k, v in os.environ.items())
+    overrides = {}
+    for f in fields(Settings):
+        raw = values.get(f.name)
+        if raw is not None:
+            try:
+                overrides[f.name] = _PARSERS.get(f.type, str)(raw)
+            except ValueError as exc:
+                raise ValueError(f"Invalid value for {f.name}: {exc}") from exc
+    return Settings(**overrides)
+
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    return Settings()
+    return _load_settings()
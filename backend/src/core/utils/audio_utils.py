@@ -1,5 +1,7 @@
-import io
-import wave
+import struct
+
+# RIFF/WAVE header for uncompressed PCM: RIFF chunk, 16-byte fmt chunk, data chunk header
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
 
 
 def pcm_to_wav(
@@ -16,10 +18,10 @@ def pcm_to_wav(
         channels: 1 for mono, 2 for stereo.
         sample_width: Bytes per sample (2 = 16-bit).
     """
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(channels)
-        wf.setsampwidth(sample_width)
-        wf.setframerate(sample_rate)
-        wf.writeframes(pcm_data)
-    return buf.getvalue()
+    block_align = channels * sample_width
+    header = _WAV_HEADER.pack(
+        b"RIFF", 36 + len(pcm_data), b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, sample_width * 8,
+        b"data", len(pcm_data),
+    )
+    return header + pcm_data
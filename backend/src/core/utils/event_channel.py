@@ -0,0 +1,37 @@
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Deque, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class EventChannel(Generic[T]):
+    """Single-producer, single-consumer event stream.
+
+    A deque plus one wake-up Event; cheaper than asyncio.Queue, which takes
+    a lock and allocates futures on every put/get.
+    """
+
+    def __init__(self):
+        self._events: Deque[Optional[T]] = deque()
+        self._ready = asyncio.Event()
+
+    def push(self, event: T) -> None:
+        self._events.append(event)
+        self._ready.set()
+
+    def close(self) -> None:
+        """Signal end of stream to the consumer."""
+        self._events.append(None)
+        self._ready.set()
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        events = self._events
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            while events:
+                event = events.popleft()
+                if event is None:
+                    return
+                yield event
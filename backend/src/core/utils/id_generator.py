@@ -1,5 +1,13 @@
+import os
 import uuid
 
 
 def generate_id() -> str:
     return uuid.uuid4().hex[:12]
+
+
+def generate_ids(n: int) -> list[str]:
+    """Generate n IDs (same format as generate_id) from a single random draw."""
+    # The first 12 hex digits of a uuid4 are 48 purely random bits
+    data = os.urandom(6 * n).hex()
+    return [data[i:i + 12] for i in range(0, 12 * n, 12)]
@@ -23,7 +23,7 @@ class GraphOutcome(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeTypeConfig:
     """Per-type concurrency and priority settings."""
     max_concurrency: int
@@ -41,7 +41,7 @@ DEFAULT_TYPE_CONFIGS: Dict[NodeType, NodeTypeConfig] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class SchedulableNode:
     """A work unit in the global scheduler.
 
@@ -56,7 +56,7 @@ class SchedulableNode:
     canvas_memory: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchContext:
     """Tracks the overall state of a batch execution."""
     batch_id: str
@@ -68,7 +68,7 @@ class BatchContext:
     graph_outcomes: Dict[str, GraphOutcome] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchEvent:
     """An event emitted during batch execution (sent to frontend via SSE)."""
     batch_id: str
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Dict, List, Optional
 from enum import Enum
 
@@ -11,7 +11,7 @@ class ExecutionStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionEvent:
     """A single event emitted during graph execution (sent to frontend via SSE)."""
     execution_id: str
@@ -21,7 +21,7 @@ class ExecutionEvent:
     data: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Tracks the state of a running graph execution."""
     execution_id: str
@@ -29,5 +29,4 @@ class ExecutionContext:
     output_node_ids: List[str]
     force: bool = False
     status: ExecutionStatus = ExecutionStatus.PENDING
-    events: List[ExecutionEvent] = field(default_factory=list)
     cancelled: bool = False
@@ -1,12 +1,12 @@
 import time
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
-from enum import Enum
+from enum import StrEnum
 
 from .enums import ArtifactType, ImageModel, VideoModel
 
 
-class ExperimentStatus(Enum):
+class ExperimentStatus(StrEnum):
     BRIEF = "brief"
     GENOME = "genome"
     BUILT = "built"
@@ -14,14 +14,14 @@ class ExperimentStatus(Enum):
     EXECUTED = "executed"
 
 
-class HookStatus(Enum):
+class HookStatus(StrEnum):
     DRAFT = "draft"
     SELECTED = "selected"
     EXECUTED = "executed"
     REJECTED = "rejected"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenomeDimension:
     name: str
     values: List[str]
@@ -43,7 +43,7 @@ class GenomeDimension:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RequiredAsset:
     name: str
     description: str = ""
@@ -56,7 +56,7 @@ class RequiredAsset:
         return cls(name=d["name"], description=d.get("description", ""))
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentGenome:
     dimensions: List[GenomeDimension]
     brief: str
@@ -96,7 +96,7 @@ class ContentGenome:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Hook:
     id: str
     graph_id: str
@@ -109,7 +109,7 @@ class Hook:
             "id": self.id,
             "graph_id": self.graph_id,
             "genome_label": self.genome_label,
-            "status": self.status.value,
+            "status": self.status,
             "label": self.label,
         }
 
@@ -124,7 +124,7 @@ class Hook:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Experiment:
     id: str
     name: str
@@ -144,7 +144,7 @@ class Experiment:
             "id": self.id,
             "name": self.name,
             "brief": self.brief,
-            "status": self.status.value,
+            "status": self.status,
             "genome": self.genome.to_dict() if self.genome else None,
             "hooks": [h.to_dict() for h in self.hooks],
             "artifact_type": self.artifact_type,
@@ -159,7 +159,13 @@ class Experiment:
     def from_dict(cls, d: dict) -> "Experiment":
         genome = ContentGenome.from_dict(d["genome"]) if d.get("genome") else None
         hooks = [Hook.from_dict(h) for h in d.get("hooks", [])]
-        now = time.time()
+        created_at = d.get("created_at")
+        updated_at = d.get("updated_at")
+        if created_at is None or updated_at is None:
+            # Only records written before the timestamps existed need the clock
+            now = time.time()
+            created_at = d.get("created_at", now)
+            updated_at = d.get("updated_at", now)
         return cls(
             id=d["id"],
             name=d["name"],
@@ -171,6 +177,6 @@ class Experiment:
             image_model=d.get("image_model", ImageModel.IMAGEN_ULTRA.value),
             video_model=d.get("video_model", VideoModel.VEO.value),
             images_per_hook=d.get("images_per_hook"),
-            created_at=d.get("created_at", now),
-            updated_at=d.get("updated_at", now),
+            created_at=created_at,
+            updated_at=updated_at,
         )
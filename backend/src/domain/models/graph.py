@@ -1,14 +1,16 @@
+import sys
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-from enum import Enum
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from enum import StrEnum
 
 from .ports import Port, PortType, PortDirection, Connection
 from .media import MediaResult
 from ...core.exceptions import CycleDetectedError, PortIncompatibleError
 
 
-class NodeType(Enum):
+class NodeType(StrEnum):
     GENERATE_TEXT = "generate_text"
     GENERATE_IMAGE = "generate_image"
     GENERATE_VIDEO = "generate_video"
@@ -18,7 +20,7 @@ class NodeType(Enum):
     TRANSFORM_IMAGE = "transform_image"
 
 
-class NodeStatus(Enum):
+class NodeStatus(StrEnum):
     IDLE = "idle"
     QUEUED = "queued"
     RUNNING = "running"
@@ -26,8 +28,7 @@ class NodeStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
-class Position:
+class Position(NamedTuple):
     x: float
     y: float
 
@@ -64,8 +65,26 @@ _PORT_SPECS: Dict[NodeType, Dict[str, list]] = {
     },
 }
 
+# _PORT_SPECS flattened once at import: per node type, (id_suffix, name, port_type,
+# description) rows for inputs and outputs, so node creation only builds the Ports
+_PortTemplate = Tuple[str, str, PortType, str]
+_PORT_TEMPLATES: Dict[NodeType, Tuple[Tuple[_PortTemplate, ...], Tuple[_PortTemplate, ...]]] = {
+    node_type: (
+        tuple(("_input_" + name, name, port_type, desc) for name, port_type, desc in spec.get("inputs", [])),
+        tuple(("_output_" + name, name, port_type, desc) for name, port_type, desc in spec.get("outputs", [])),
+    )
+    for node_type, spec in _PORT_SPECS.items()
+}
+_NO_PORTS: Tuple[tuple, tuple] = ((), ())
+_INPUT = PortDirection.INPUT
+_OUTPUT = PortDirection.OUTPUT
+
+# DFS node states for Graph._would_create_cycle
+_VISITING = 1
+_DONE = 2
+
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """A processing node with typed input/output ports."""
     id: str
@@ -80,35 +99,39 @@ class Node:
     result: Optional[MediaResult] = None
     error_message: Optional[str] = None
     stale: bool = False
+    # Lazily built port_id -> Port maps; ports are not mutated after construction
+    _input_port_index: Optional[Dict[str, Port]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    _output_port_index: Optional[Dict[str, Port]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     def __post_init__(self):
         if not self.input_ports and not self.output_ports:
             self._initialize_ports()
 
     def _initialize_ports(self):
-        spec = _PORT_SPECS.get(self.type, {})
-        for name, port_type, desc in spec.get("inputs", []):
-            self.input_ports.append(Port(
-                id=f"{self.id}_input_{name}",
-                name=name,
-                port_type=port_type,
-                direction=PortDirection.INPUT,
-                description=desc,
-            ))
-        for name, port_type, desc in spec.get("outputs", []):
-            self.output_ports.append(Port(
-                id=f"{self.id}_output_{name}",
-                name=name,
-                port_type=port_type,
-                direction=PortDirection.OUTPUT,
-                description=desc,
-            ))
+        inputs, outputs = _PORT_TEMPLATES.get(self.type, _NO_PORTS)
+        node_id = self.id
+        self.input_ports = [
+            Port(node_id + suffix, name, port_type, _INPUT, description=desc)
+            for suffix, name, port_type, desc in inputs
+        ]
+        self.output_ports = [
+            Port(node_id + suffix, name, port_type, _OUTPUT, description=desc)
+            for suffix, name, port_type, desc in outputs
+        ]
 
     def get_input_port(self, port_id: str) -> Optional[Port]:
-        return next((p for p in self.input_ports if p.id == port_id), None)
+        if self._input_port_index is None:
+            self._input_port_index = {p.id: p for p in self.input_ports}
+        return self._input_port_index.get(port_id)
 
     def get_output_port(self, port_id: str) -> Optional[Port]:
-        return next((p for p in self.output_ports if p.id == port_id), None)
+        if self._output_port_index is None:
+            self._output_port_index = {p.id: p for p in self.output_ports}
+        return self._output_port_index.get(port_id)
 
     def add_generation(self, result: MediaResult) -> None:
         self.result = result
@@ -118,12 +141,12 @@ class Node:
     def to_dict(self) -> dict:
         return {
             "id": self.id,
-            "type": self.type.value,
+            "type": self.type,
             "label": self.label,
             "params": self.params,
             "position": {"x": self.position.x, "y": self.position.y},
             "provider": self.provider,
-            "status": self.status.value,
+            "status": self.status,
             "input_ports": [p.to_dict() for p in self.input_ports],
             "output_ports": [p.to_dict() for p in self.output_ports],
             "result": self.result.to_dict() if self.result else None,
@@ -135,7 +158,7 @@ class Node:
     def from_dict(cls, d: dict) -> "Node":
         result = MediaResult.from_dict(d["result"]) if d.get("result") else None
         return cls(
-            id=d["id"],
+            id=sys.intern(d["id"]),
             type=NodeType(d["type"]),
             label=d["label"],
             params=d["params"],
@@ -150,7 +173,7 @@ class Node:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     """A connection between two node ports."""
     id: str
@@ -179,16 +202,17 @@ class Edge:
 
     @classmethod
     def from_dict(cls, d: dict) -> "Edge":
+        intern = sys.intern
         conn = Connection(
-            from_node_id=d["from_node_id"],
-            from_port_id=d["from_port_id"],
-            to_node_id=d["to_node_id"],
-            to_port_id=d["to_port_id"],
+            from_node_id=intern(d["from_node_id"]),
+            from_port_id=intern(d["from_port_id"]),
+            to_node_id=intern(d["to_node_id"]),
+            to_port_id=intern(d["to_port_id"]),
         )
-        return cls(id=d["id"], connection=conn)
+        return cls(id=intern(d["id"]), connection=conn)
 
 
-@dataclass
+@dataclass(slots=True)
 class Graph:
     """A DAG of nodes connected by typed port edges."""
     id: str
@@ -199,6 +223,17 @@ class Graph:
     nodes: Dict[str, Node] = field(default_factory=dict)
     edges: List[Edge] = field(default_factory=list)
     experiment_id: str | None = None
+    # Lazily built node_id -> upstream / downstream node_ids; reset whenever edges change
+    _dependency_index: Optional[Dict[str, List[str]]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    _downstream_index: Optional[Dict[str, List[str]]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    # Memoized get_downstream_nodes results, reset along with the indexes
+    _downstream_sets: Dict[str, frozenset] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
 
     def to_dict(self) -> dict:
         return {
@@ -214,14 +249,21 @@ class Graph:
 
     @classmethod
     def from_dict(cls, d: dict) -> "Graph":
-        nodes = {nid: Node.from_dict(nd) for nid, nd in d["nodes"].items()}
+        # IDs are interned so the node map, edges and indexes share one string per ID
+        nodes = {sys.intern(nid): Node.from_dict(nd) for nid, nd in d["nodes"].items()}
         edges = [Edge.from_dict(ed) for ed in d["edges"]]
-        now = time.time()
+        created_at = d.get("created_at")
+        updated_at = d.get("updated_at")
+        if created_at is None or updated_at is None:
+            # Only records written before the timestamps existed need the clock
+            now = time.time()
+            created_at = d.get("created_at", now)
+            updated_at = d.get("updated_at", now)
         return cls(
             id=d["id"], name=d["name"],
             canvas_memory=d.get("canvas_memory", ""),
-            created_at=d.get("created_at", now),
-            updated_at=d.get("updated_at", now),
+            created_at=created_at,
+            updated_at=updated_at,
             nodes=nodes, edges=edges,
             experiment_id=d.get("experiment_id"),
         )
@@ -232,7 +274,13 @@ class Graph:
     def get_node(self, node_id: str) -> Optional[Node]:
         return self.nodes.get(node_id)
 
-    def add_edge(self, edge: Edge) -> None:
+    def add_edge(self, edge: Edge, validate: bool = True) -> None:
+        if validate:
+            self._validate_edge(edge)
+        self.edges.append(edge)
+        self._invalidate_indexes()
+
+    def _validate_edge(self, edge: Edge) -> None:
         conn = edge.connection
         from_node = self.get_node(conn.from_node_id)
         to_node = self.get_node(conn.to_node_id)
@@ -252,10 +300,9 @@ class Graph:
         if self._would_create_cycle(conn):
             raise CycleDetectedError(conn.from_node_id, conn.to_node_id)
 
-        self.edges.append(edge)
-
     def remove_edge(self, edge_id: str) -> None:
         self.edges = [e for e in self.edges if e.id != edge_id]
+        self._invalidate_indexes()
 
     def remove_node(self, node_id: str) -> None:
         self.nodes.pop(node_id, None)
@@ -264,61 +311,106 @@ class Graph:
             if e.connection.from_node_id != node_id
             and e.connection.to_node_id != node_id
         ]
+        self._invalidate_indexes()
+
+    def _invalidate_indexes(self) -> None:
+        self._dependency_index = None
+        self._downstream_index = None
+        self._downstream_sets.clear()
 
     def get_incoming_edges(self, node_id: str) -> List[Edge]:
         return [e for e in self.edges if e.connection.to_node_id == node_id]
 
+    def dependency_index(self) -> Dict[str, List[str]]:
+        """Map each node ID to its upstream node IDs, built in one pass over edges."""
+        if self._dependency_index is None:
+            index: Dict[str, List[str]] = {}
+            for e in self.edges:
+                index.setdefault(e.connection.to_node_id, []).append(e.connection.from_node_id)
+            self._dependency_index = index
+        return self._dependency_index
+
+    def downstream_index(self) -> Dict[str, List[str]]:
+        """Map each node ID to its downstream node IDs, built in one pass over edges."""
+        if self._downstream_index is None:
+            index: Dict[str, List[str]] = {}
+            for e in self.edges:
+                index.setdefault(e.connection.from_node_id, []).append(e.connection.to_node_id)
+            self._downstream_index = index
+        return self._downstream_index
+
     def get_dependencies(self, node_id: str) -> List[str]:
-        return [e.connection.from_node_id for e in self.get_incoming_edges(node_id)]
+        return list(self.dependency_index().get(node_id, ()))
 
     def get_downstream_nodes(self, node_id: str) -> List[str]:
         """BFS forward walk: return all node IDs reachable downstream from node_id."""
+        return list(self._downstream_set(node_id))
+
+    def _downstream_set(self, node_id: str) -> frozenset:
+        cached = self._downstream_sets.get(node_id)
+        if cached is not None:
+            return cached
+        index = self.downstream_index()
         visited: set = set()
-        queue = [node_id]
+        queue = deque([node_id])
         while queue:
-            nid = queue.pop(0)
+            nid = queue.popleft()
             if nid in visited:
                 continue
             visited.add(nid)
-            for edge in self.edges:
-                if edge.connection.from_node_id == nid:
-                    queue.append(edge.connection.to_node_id)
+            queue.extend(index.get(nid, ()))
         visited.discard(node_id)  # exclude the starting node itself
-        return list(visited)
+        result = self._downstream_sets[node_id] = frozenset(visited)
+        return result
 
     def mark_stale(self, node_id: str) -> None:
         """Mark the given node and all its downstream dependents as stale."""
         node = self.get_node(node_id)
         if node:
             node.stale = True
-        for downstream_id in self.get_downstream_nodes(node_id):
+        for downstream_id in self._downstream_set(node_id):
             downstream = self.get_node(downstream_id)
             if downstream:
                 downstream.stale = True
 
-    def _would_create_cycle(self, new_conn: Connection) -> bool:
-        adj: Dict[str, List[str]] = {nid: [] for nid in self.nodes}
-        for edge in self.edges:
-            adj[edge.connection.from_node_id].append(edge.connection.to_node_id)
-        adj.setdefault(new_conn.from_node_id, []).append(new_conn.to_node_id)
-
-        visited: set = set()
-        rec_stack: set = set()
-
-        def has_cycle(node: str) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-            for neighbor in adj.get(node, []):
-                if neighbor not in visited:
-                    if has_cycle(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
-            rec_stack.discard(node)
-            return False
+    def mark_stale_many(self, node_ids: Iterable[str]) -> None:
+        """Mark several nodes and everything downstream of them stale in one BFS."""
+        index = self.downstream_index()
+        visited = set(node_ids)
+        queue = deque(visited)
+        while queue:
+            for next_id in index.get(queue.popleft(), ()):
+                if next_id not in visited:
+                    visited.add(next_id)
+                    queue.append(next_id)
+        for nid in visited:
+            node = self.nodes.get(nid)
+            if node:
+                node.stale = True
 
-        for nid in adj:
-            if nid not in visited:
-                if has_cycle(nid):
+    def _would_create_cycle(self, new_conn: Connection) -> bool:
+        # Cached adjacency plus the prospective edge; the cached lists are not mutated
+        adj = dict(self.downstream_index())
+        adj[new_conn.from_node_id] = [*adj.get(new_conn.from_node_id, ()), new_conn.to_node_id]
+
+        # Iterative DFS: nodes on the current path are _VISITING, finished ones _DONE
+        state: Dict[str, int] = {}
+        for root in self.nodes:
+            if root in state:
+                continue
+            state[root] = _VISITING
+            stack = [(root, iter(adj.get(root, ())))]
+            while stack:
+                node, neighbors = stack[-1]
+                neighbor = next(neighbors, None)
+                if neighbor is None:
+                    state[node] = _DONE
+                    stack.pop()
+                    continue
+                seen = state.get(neighbor)
+                if seen is None:
+                    state[neighbor] = _VISITING
+                    stack.append((neighbor, iter(adj.get(neighbor, ()))))
+                elif seen == _VISITING:
                     return True
         return False
@@ -1,22 +1,22 @@
 from dataclasses import dataclass, field
 from typing import Dict, Optional
-from enum import Enum
+from enum import StrEnum
 
 
-class MediaType(Enum):
+class MediaType(StrEnum):
     IMAGE = "image"
     VIDEO = "video"
     AUDIO = "audio"
     TEXT = "text"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MediaUrls:
     original: str
     thumbnail: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MediaMetadata:
     width: Optional[int] = None
     height: Optional[int] = None
@@ -25,7 +25,7 @@ class MediaMetadata:
     size_bytes: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaResult:
     id: str
     timestamp: int
@@ -40,7 +40,7 @@ class MediaResult:
         return {
             "id": self.id,
             "timestamp": self.timestamp,
-            "media_type": self.media_type.value,
+            "media_type": self.media_type,
             "urls": {"original": self.urls.original, "thumbnail": self.urls.thumbnail},
             "prompt": self.prompt,
             "metadata": {
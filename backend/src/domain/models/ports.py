@@ -1,8 +1,9 @@
+import sys
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 
 
-class PortType(Enum):
+class PortType(StrEnum):
     """Data types that can flow through ports."""
     IMAGE = "image"
     VIDEO = "video"
@@ -11,12 +12,19 @@ class PortType(Enum):
     ANY = "any"
 
 
-class PortDirection(Enum):
+class PortDirection(StrEnum):
     INPUT = "input"
     OUTPUT = "output"
 
 
-@dataclass
+# (type, type) pairs that may be connected: identical types, or either side ANY
+_COMPATIBLE_TYPES = frozenset(
+    (a, b) for a in PortType for b in PortType
+    if a is PortType.ANY or b is PortType.ANY or a is b
+)
+
+
+@dataclass(slots=True)
 class Port:
     """A typed connection point on a node."""
     id: str
@@ -27,35 +35,36 @@ class Port:
     description: str = ""
 
     def is_compatible_with(self, other: "Port") -> bool:
-        if self.direction == other.direction:
-            return False
-        if self.port_type == PortType.ANY or other.port_type == PortType.ANY:
-            return True
-        return self.port_type == other.port_type
+        return (
+            self.direction is not other.direction
+            and (self.port_type, other.port_type) in _COMPATIBLE_TYPES
+        )
 
     def to_dict(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
-            "port_type": self.port_type.value,
-            "direction": self.direction.value,
+            "port_type": self.port_type,
+            "direction": self.direction,
             "required": self.required,
             "description": self.description,
         }
 
     @classmethod
     def from_dict(cls, d: dict) -> "Port":
+        # Names and descriptions come from a handful of per-node-type constants;
+        # interning collapses the copies parsed from every node into one string each
         return cls(
-            id=d["id"],
-            name=d["name"],
+            id=sys.intern(d["id"]),
+            name=sys.intern(d["name"]),
             port_type=PortType(d["port_type"]),
             direction=PortDirection(d["direction"]),
             required=d.get("required", True),
-            description=d.get("description", ""),
+            description=sys.intern(d.get("description", "")),
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Connection:
     """A link between two specific ports on two nodes."""
     from_node_id: str
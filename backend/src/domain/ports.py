@@ -85,6 +85,9 @@ class GraphRepositoryPort(ABC):
     @abstractmethod
     async def save(self, graph: Graph) -> None: ...
 
+    @abstractmethod
+    async def save_many(self, graphs: List[Graph]) -> None: ...
+
     @abstractmethod
     async def load(self, graph_id: str) -> Optional[Graph]: ...
 
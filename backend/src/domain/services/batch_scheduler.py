@@ -1,15 +1,18 @@
 """Global DAG-aware scheduler with per-type concurrency control.
 
 Flattens multiple graphs into a single node pool and executes them
-with dependency-aware scheduling, per-NodeType semaphores, and
+with dependency-aware scheduling, per-NodeType worker pools, and
 per-graph failure isolation.
 """
 
 import asyncio
+import itertools
 import logging
 import time
+from collections import Counter, OrderedDict
 from typing import AsyncGenerator, Dict, List, Optional, Set
 
+from ...core.utils.event_channel import EventChannel
 from ..models.batch_execution import (
     BatchContext,
     BatchEvent,
@@ -26,6 +29,12 @@ from .node_executor import NodeExecutor
 
 logger = logging.getLogger(__name__)
 
+# Worker pool size for node types missing from the type configs
+_DEFAULT_CONCURRENCY = 4
+
+# Queue rank of a worker's stop sentinel; sorts after every node
+_STOP_RANK = float("inf")
+
 
 class BatchScheduler:
     """Event-driven scheduler that executes nodes from multiple graphs
@@ -65,7 +74,7 @@ class BatchScheduler:
 
         # --- Internal state ---
         state = _SchedulerState(nodes, context, self._type_configs)
-        event_queue: asyncio.Queue[BatchEvent | None] = asyncio.Queue()
+        events: EventChannel[BatchEvent] = EventChannel()
 
         # --- Pre-process: skip already-completed nodes ---
         for sn in nodes:
@@ -76,14 +85,22 @@ class BatchScheduler:
                     node_id=sn.node_id, data={"reason": "already completed"},
                 )
 
-        # --- Spawn initial ready nodes ---
-        initial_ready = state.get_ready_nodes()
-        for sn in initial_ready:
+        # --- Start per-type worker pools for the nodes left to run ---
+        pending_types = Counter(
+            sn.node_type for sn in nodes if not state.is_finished(sn.node_id)
+        )
+        for node_type, count in pending_types.items():
+            queue = state.open_queue(node_type, count)
+            for _ in range(state.worker_count(node_type)):
+                task = asyncio.create_task(
+                    self._worker(queue, state, context, events)
+                )
+                state.track_task(task)
+
+        # --- Dispatch initial ready nodes ---
+        for sn in state.get_ready_nodes():
             state.mark_launched(sn.node_id)
-            task = asyncio.create_task(
-                self._run_node(sn, state, context, event_queue)
-            )
-            state.track_task(task)
+            state.enqueue(sn)
 
         if state.remaining == 0:
             # All nodes were skipped — emit completions and return
@@ -101,10 +118,7 @@ class BatchScheduler:
             return
 
         # --- Drain events from worker tasks ---
-        while True:
-            event = await event_queue.get()
-            if event is None:
-                break
+        async for event in events:
             yield event
 
         # --- Emit terminal batch event ---
@@ -120,62 +134,64 @@ class BatchScheduler:
                 },
             })
 
+    async def _worker(
+        self,
+        queue: "asyncio.PriorityQueue[tuple]",
+        state: "_SchedulerState",
+        context: BatchContext,
+        events: EventChannel[BatchEvent],
+    ) -> None:
+        """Run nodes of one type off its queue until the pool is stopped."""
+        while True:
+            *_, sn = await queue.get()
+            if sn is None:
+                return
+            await self._run_node(sn, state, context, events)
+
     async def _run_node(
         self,
         sn: SchedulableNode,
         state: "_SchedulerState",
         context: BatchContext,
-        event_queue: asyncio.Queue,
+        events: EventChannel[BatchEvent],
     ) -> None:
-        """Execute a single node: acquire semaphore, run, promote children."""
-        sem = state.get_semaphore(sn.node_type)
+        """Execute a single node: run, record the result, promote children."""
         try:
-            async with sem:
-                if context.cancelled or state.is_graph_failed(sn.graph_id):
-                    return
-
-                sn.node.status = NodeStatus.RUNNING
-                await event_queue.put(self._event(
-                    context, "node_started",
-                    graph_id=sn.graph_id, node_id=sn.node_id,
-                ))
+            if context.cancelled or state.is_graph_failed(sn.graph_id):
+                return
 
-                input_data = await self._input_resolver.resolve(
-                    sn.graph, sn.node_id, state.node_results,
-                )
-                result = await self._node_executor.execute(
-                    sn.node, input_data, sn.canvas_memory,
-                )
+            sn.node.status = NodeStatus.RUNNING
+            events.push(self._event(
+                context, "node_started",
+                graph_id=sn.graph_id, node_id=sn.node_id,
+            ))
 
-                sn.node.add_generation(result)
-                state.mark_completed(sn, result)
-
-                await event_queue.put(self._event(
-                    context, "node_completed",
-                    graph_id=sn.graph_id, node_id=sn.node_id,
-                    data={
-                        "media_type": result.media_type.value,
-                        "urls": {
-                            "original": result.urls.original,
-                            "thumbnail": result.urls.thumbnail,
-                        },
-                    },
+            input_data = await self._input_resolver.resolve(
+                sn.graph, sn.node_id, state.node_results, state.media_cache,
+            )
+            result = await self._node_executor.execute(
+                sn.node, input_data, sn.canvas_memory,
+            )
+
+            sn.node.add_generation(result)
+            graph_complete = state.mark_completed(sn, result)
+
+            events.push(self._event(
+                context, "node_completed",
+                graph_id=sn.graph_id, node_id=sn.node_id,
+                # MediaUrls is frozen; the SSE encoder writes it as {original, thumbnail}
+                data={"media_type": result.media_type, "urls": result.urls},
+            ))
+
+            if graph_complete:
+                context.graph_outcomes[sn.graph_id] = GraphOutcome.COMPLETED
+                events.push(self._event(
+                    context, "graph_completed", graph_id=sn.graph_id,
                 ))
 
-                # Check if this graph just completed
-                if state.is_graph_complete(sn.graph_id):
-                    context.graph_outcomes[sn.graph_id] = GraphOutcome.COMPLETED
-                    await event_queue.put(self._event(
-                        context, "graph_completed", graph_id=sn.graph_id,
-                    ))
-
-                # Promote ready children
-                ready_children = state.promote_children(sn.node_id)
-                for child_sn in ready_children:
-                    task = asyncio.create_task(
-                        self._run_node(child_sn, state, context, event_queue)
-                    )
-                    state.track_task(task)
+            # Promote ready children
+            for child_sn in state.promote_children(sn.node_id):
+                state.enqueue(child_sn)
 
         except Exception as e:
             logger.error("Node %s (graph %s) failed: %s", sn.node_id, sn.graph_id, e, exc_info=True)
@@ -185,12 +201,12 @@ class BatchScheduler:
             state.mark_graph_failed(sn)
             context.graph_outcomes[sn.graph_id] = GraphOutcome.FAILED
 
-            await event_queue.put(self._event(
+            events.push(self._event(
                 context, "node_failed",
                 graph_id=sn.graph_id, node_id=sn.node_id,
                 data={"error": str(e)},
             ))
-            await event_queue.put(self._event(
+            events.push(self._event(
                 context, "graph_failed",
                 graph_id=sn.graph_id, data={"error": str(e)},
             ))
@@ -198,7 +214,8 @@ class BatchScheduler:
         finally:
             state.decrement_remaining()
             if state.remaining == 0:
-                await event_queue.put(None)  # sentinel: all work done
+                state.stop_workers()
+                events.close()  # all work done
 
     @staticmethod
     def _is_skippable(sn: SchedulableNode, force: bool) -> bool:
@@ -235,6 +252,13 @@ class _SchedulerState:
     (single-threaded asyncio event loop — mutations between awaits are atomic).
     """
 
+    __slots__ = (
+        "_node_map", "_type_configs", "_pending_deps", "_children", "_sort_key",
+        "_graph_total", "_graph_done", "_graph_members", "node_results", "media_cache",
+        "_finished", "_launched", "_failed_graphs", "_queues", "_worker_counts",
+        "_enqueued", "_workers", "_remaining",
+    )
+
     def __init__(
         self,
         nodes: List[SchedulableNode],
@@ -247,44 +271,78 @@ class _SchedulerState:
         # Dependency tracking
         self._pending_deps: Dict[str, int] = {}
         self._children: Dict[str, Set[str]] = {sn.node_id: set() for sn in nodes}
+        node_ids = self._node_map.keys()
         for sn in nodes:
-            valid_deps = sn.dependencies & set(self._node_map.keys())
+            valid_deps = sn.dependencies & node_ids
             self._pending_deps[sn.node_id] = len(valid_deps)
             for dep_id in valid_deps:
                 self._children[dep_id].add(sn.node_id)
 
+        # Launch order: type priority first, then longest chain of dependents,
+        # so nodes on the critical path reach the type queues first
+        critical = self._critical_path_lengths()
+        self._sort_key: Dict[str, tuple] = {
+            sn.node_id: (self._get_priority(sn.node_type), critical.get(sn.node_id, 1))
+            for sn in nodes
+        }
+
         # Per-graph node counts for completion detection
         self._graph_total: Dict[str, int] = {}
         self._graph_done: Dict[str, int] = {}
+        self._graph_members: Dict[str, List[str]] = {}
         for sn in nodes:
             self._graph_total[sn.graph_id] = self._graph_total.get(sn.graph_id, 0) + 1
-            self._graph_done.setdefault(sn.graph_id, 0)
+            self._graph_members.setdefault(sn.graph_id, []).append(sn.node_id)
 
-        # Result storage
+        # Result storage, plus upstream media bytes read for this batch only
         self.node_results: Dict[str, MediaResult] = {}
+        self.media_cache: OrderedDict[str, bytes] = OrderedDict()
 
         # Tracking sets
         self._finished: Set[str] = set()   # completed or skipped node IDs
         self._launched: Set[str] = set()   # node IDs that have been dispatched
         self._failed_graphs: Set[str] = set()
 
-        # Concurrency semaphores
-        self._semaphores: Dict[NodeType, asyncio.Semaphore] = {
-            nt: asyncio.Semaphore(cfg.max_concurrency)
-            for nt, cfg in type_configs.items()
-        }
-        self._default_semaphore = asyncio.Semaphore(4)
+        # Per-type work queues, ordered by _sort_key so a node on the critical
+        # path is never stuck behind one promoted earlier. Each is drained by at
+        # most max_concurrency workers; the counter keeps equal ranks FIFO.
+        self._queues: Dict[NodeType, asyncio.PriorityQueue] = {}
+        self._worker_counts: Dict[NodeType, int] = {}
+        self._enqueued = itertools.count()
 
-        # Active tasks + remaining counter
-        self._active_tasks: Set[asyncio.Task] = set()
+        # Worker tasks + remaining counter
+        self._workers: List[asyncio.Task] = []
         self._remaining = len(nodes)
 
     @property
     def remaining(self) -> int:
         return self._remaining
 
-    def get_semaphore(self, node_type: NodeType) -> asyncio.Semaphore:
-        return self._semaphores.get(node_type, self._default_semaphore)
+    def open_queue(self, node_type: NodeType, pending: int) -> asyncio.PriorityQueue:
+        """Create the work queue for a type; workers are capped by its pending nodes."""
+        cfg = self._type_configs.get(node_type)
+        limit = cfg.max_concurrency if cfg else _DEFAULT_CONCURRENCY
+        self._worker_counts[node_type] = min(limit, pending)
+        queue = self._queues[node_type] = asyncio.PriorityQueue()
+        return queue
+
+    def worker_count(self, node_type: NodeType) -> int:
+        return self._worker_counts[node_type]
+
+    def enqueue(self, sn: SchedulableNode) -> None:
+        priority, critical = self._sort_key[sn.node_id]
+        self._queues[sn.node_type].put_nowait(
+            (-priority, -critical, next(self._enqueued), sn)
+        )
+
+    def stop_workers(self) -> None:
+        """Send every worker its stop sentinel, queued behind any remaining work."""
+        for node_type, queue in self._queues.items():
+            for _ in range(self._worker_counts[node_type]):
+                queue.put_nowait((_STOP_RANK, 0, next(self._enqueued), None))
+
+    def is_finished(self, node_id: str) -> bool:
+        return node_id in self._finished
 
     def mark_skipped(self, sn: SchedulableNode) -> None:
         """Mark a node as skipped (already completed). Decrements children deps."""
@@ -294,25 +352,29 @@ class _SchedulerState:
         self._graph_done[sn.graph_id] = self._graph_done.get(sn.graph_id, 0) + 1
         self._remaining -= 1
 
-        for child_id in self._children.get(sn.node_id, set()):
+        for child_id in self._children[sn.node_id]:
             self._pending_deps[child_id] -= 1
 
     def mark_launched(self, node_id: str) -> None:
         self._launched.add(node_id)
 
-    def mark_completed(self, sn: SchedulableNode, result: MediaResult) -> None:
+    def mark_completed(self, sn: SchedulableNode, result: MediaResult) -> bool:
+        """Record a node's result. Returns True if this finished its graph."""
         self.node_results[sn.node_id] = result
         self._finished.add(sn.node_id)
-        self._graph_done[sn.graph_id] = self._graph_done.get(sn.graph_id, 0) + 1
+        done = self._graph_done.get(sn.graph_id, 0) + 1
+        self._graph_done[sn.graph_id] = done
+        return done >= self._graph_total[sn.graph_id]
 
     def mark_graph_failed(self, sn: SchedulableNode) -> None:
         """Mark a node's graph as failed, finishing all its remaining nodes."""
         self._finished.add(sn.node_id)
         self._failed_graphs.add(sn.graph_id)
 
-        # Count all un-finished nodes in this graph as done (they won't execute)
-        for nid, other_sn in self._node_map.items():
-            if other_sn.graph_id == sn.graph_id and nid not in self._finished:
+        # Count the graph's never-launched nodes as done (they won't execute).
+        # Launched ones still have a task that decrements remaining on exit.
+        for nid in self._graph_members[sn.graph_id]:
+            if nid not in self._finished and nid not in self._launched:
                 self._finished.add(nid)
                 self._graph_done[sn.graph_id] = self._graph_done.get(sn.graph_id, 0) + 1
                 self._remaining -= 1
@@ -332,14 +394,17 @@ class _SchedulerState:
                     and self._node_map[node_id].graph_id not in self._failed_graphs):
                 ready.append(self._node_map[node_id])
 
-        # Sort by priority (higher = first)
-        ready.sort(key=lambda sn: self._get_priority(sn.node_type), reverse=True)
+        # Higher priority / longer critical path first
+        ready.sort(key=lambda sn: self._sort_key[sn.node_id], reverse=True)
         return ready
 
     def promote_children(self, parent_id: str) -> List[SchedulableNode]:
-        """Decrement deps for children of a completed node. Return newly ready ones."""
+        """Decrement deps for children of a completed node. Return newly ready ones.
+
+        No ordering here: the type queues rank them against everything already waiting.
+        """
         newly_ready: List[SchedulableNode] = []
-        for child_id in self._children.get(parent_id, set()):
+        for child_id in self._children[parent_id]:
             self._pending_deps[child_id] -= 1
             if (self._pending_deps[child_id] <= 0
                     and child_id not in self._launched
@@ -349,12 +414,29 @@ class _SchedulerState:
         return newly_ready
 
     def track_task(self, task: asyncio.Task) -> None:
-        self._active_tasks.add(task)
-        task.add_done_callback(self._active_tasks.discard)
+        # Only anchors the worker so it isn't garbage-collected mid-run;
+        # the list lives as long as the batch
+        self._workers.append(task)
 
     def decrement_remaining(self) -> None:
         self._remaining -= 1
 
+    def _critical_path_lengths(self) -> Dict[str, int]:
+        """Length of the longest dependent chain starting at each node (itself included)."""
+        # Kahn topological order, then fold lengths back from the sinks
+        pending = dict(self._pending_deps)
+        order = [nid for nid, count in pending.items() if count == 0]
+        for nid in order:
+            for child_id in self._children[nid]:
+                pending[child_id] -= 1
+                if pending[child_id] == 0:
+                    order.append(child_id)
+
+        lengths: Dict[str, int] = {}
+        for nid in reversed(order):
+            lengths[nid] = 1 + max((lengths[c] for c in self._children[nid]), default=0)
+        return lengths
+
     def _get_priority(self, node_type: NodeType) -> int:
         cfg = self._type_configs.get(node_type)
         return cfg.priority if cfg else 0
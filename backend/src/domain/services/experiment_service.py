@@ -1,7 +1,8 @@
-import json
 import logging
 from typing import Dict, List
 
+import orjson
+
 from ...core.utils.id_generator import generate_id
 from ..models.enums import ArtifactType, ImageModel, VideoModel
 from ..models.experiment import ContentGenome, GenomeDimension, RequiredAsset
@@ -10,7 +11,7 @@ from ..ports import AIGenerationPort
 
 logger = logging.getLogger(__name__)
 
-_VALID_NODE_TYPES = {t.value for t in NodeType}
+_VALID_NODE_TYPES = frozenset(t.value for t in NodeType)
 
 # ---------------------------------------------------------------------------
 # Genome generation prompt
@@ -82,10 +83,10 @@ _GENOME_RULE_9 = """\
    "description": "Minimalist serif wordmark in white or silver, must be readable"}}]
 """
 
-
-def _build_genome_prompt(artifact_type: str) -> str:
-    rule_8 = _GENOME_IMAGE_RULE_8 if artifact_type == ArtifactType.IMAGE else _GENOME_VIDEO_RULE_8
-    return f"{_GENOME_BASE_PROMPT}\n{rule_8}\n{_GENOME_RULE_9}"
+_GENOME_PROMPTS = {
+    ArtifactType.IMAGE: f"{_GENOME_BASE_PROMPT}\n{_GENOME_IMAGE_RULE_8}\n{_GENOME_RULE_9}",
+    ArtifactType.VIDEO: f"{_GENOME_BASE_PROMPT}\n{_GENOME_VIDEO_RULE_8}\n{_GENOME_RULE_9}",
+}
 
 _GENOME_OUTPUT_FIELDS = [
     {
@@ -381,6 +382,69 @@ When required_assets are specified in the genome, generate a reference image for
 that needs visual consistency in the final video.
 """
 
+# Full architect system prompt per artifact type. It always leads the request
+# so repeated architect calls share a byte-identical prefix, which Gemini's
+# implicit context caching bills at the cached-token rate.
+_ARCHITECT_SYSTEM_PROMPTS = {
+    ArtifactType.IMAGE: f"{_GRAPH_ARCHITECT_BASE_PROMPT}\n\n{_IMAGE_ARCHITECT_PROMPT}",
+    ArtifactType.VIDEO: f"{_GRAPH_ARCHITECT_BASE_PROMPT}\n\n{_VIDEO_ARCHITECT_PROMPT}",
+}
+
+# Reference image usage -> short label for canvas memory
+_REF_USAGE_LABELS = {
+    "style": "Match the reference image's visual style and aesthetic",
+    "composition": "Follow the reference image's composition and framing",
+    "mood": "Capture the reference image's emotional tone and atmosphere",
+    "recreate": "Closely recreate the reference image's overall look",
+}
+
+# Reference image usage -> full instruction for the architect prompt
+_REF_USAGE_INSTRUCTIONS = {
+    "style": "Match the visual style, color grading, lighting approach, and aesthetic of the reference image. The subject matter may differ, but the look and feel must be consistent.",
+    "composition": "Follow the composition, framing, camera angle, and spatial arrangement of the reference image. Adapt subject matter but preserve compositional structure.",
+    "mood": "Capture the emotional tone, atmosphere, and feeling of the reference image. Visuals may differ but must evoke the same emotional response.",
+    "recreate": "Closely recreate the reference image with the brief's subject matter. Match composition, style, lighting, color palette, and mood as closely as possible.",
+}
+
+
+def _build_creative_directives(genome: ContentGenome, ref_description: str) -> tuple[str, str]:
+    """Return (canvas memory directive, architect prompt section) for a genome.
+
+    Both carry the desired outcome and the reference image direction, worded
+    for their audience; the usage lookup is shared.
+    """
+    cm_parts: list[str] = []
+    creative_sections: list[str] = []
+    if genome.desired_outcome:
+        cm_parts.append(
+            "CREATIVE DIRECTIVE (highest priority — all content must realize this vision):\n"
+            + genome.desired_outcome
+        )
+        creative_sections.append(
+            "## Creative Directive — Desired Outcome\n\n"
+            "The client has specified exactly what they want the final creative to look and feel like:\n\n"
+            f"> {genome.desired_outcome}\n\n"
+            "This is the NORTH STAR for every pipeline you design. Your terminal node's prompt must\n"
+            "describe this exact outcome. Every upstream prompt-writer node must craft prompts that\n"
+            "build toward realizing this specific vision. Do not deviate."
+        )
+    if ref_description:
+        usage = genome.reference_image_usage or "style"
+        usage_key = usage if usage in _REF_USAGE_LABELS else "style"
+        cm_parts.append(
+            f"REFERENCE IMAGE DIRECTION ({_REF_USAGE_LABELS[usage_key]}):\n"
+            + ref_description
+        )
+        creative_sections.append(
+            "## Reference Image Analysis\n\n"
+            f"The client provided a reference image (usage: **{usage}**).\n\n"
+            f"Detailed analysis:\n{ref_description}\n\n"
+            f"Instruction: {_REF_USAGE_INSTRUCTIONS[usage_key]}\n\n"
+            "Incorporate this reference direction into every prompt-writer node's instructions."
+        )
+    return "\n\n".join(cm_parts), "\n\n".join(creative_sections)
+
+
 # Layout constants for auto-positioning nodes
 _X_START = 50
 _Y_START = 50
@@ -393,7 +457,8 @@ class ExperimentService:
         self._ai = ai
 
     async def generate_genome(self, brief: str, artifact_type: str = ArtifactType.VIDEO.value) -> ContentGenome:
-        system_prompt = _build_genome_prompt(artifact_type)
+        # Anything that isn't an image experiment gets the video rules
+        system_prompt = _GENOME_PROMPTS.get(artifact_type, _GENOME_PROMPTS[ArtifactType.VIDEO])
         prompt = f"""{system_prompt}
 
 Creative brief:
@@ -412,8 +477,8 @@ Analyze this brief and return the Content Genome as JSON."""
 
         logger.debug("Genome LLM response: %s", response[:500])
         try:
-            data = json.loads(response)
-        except (json.JSONDecodeError, TypeError) as exc:
+            data = orjson.loads(response)
+        except (orjson.JSONDecodeError, TypeError) as exc:
             logger.error("Failed to parse genome JSON: %s\nRaw: %s", exc, response)
             raise ValueError(f"AI returned invalid JSON for genome: {exc}") from exc
 
@@ -469,37 +534,20 @@ Analyze this brief and return the Content Genome as JSON."""
                 {"temperature": 0.3},
             )
 
+        canvas_memory_directive, creative_directive_text = _build_creative_directives(
+            genome, ref_description,
+        )
+
         hook_specs = await self._call_graph_architect(
             genome=genome,
             count=count,
             artifact_type=artifact_type,
             image_model=image_model,
             video_model=video_model,
-            ref_description=ref_description,
+            creative_directive_text=creative_directive_text,
             images_per_hook=images_per_hook,
         )
 
-        # Build canvas_memory creative directive (computed once before the loop)
-        cm_parts: list[str] = []
-        if genome.desired_outcome:
-            cm_parts.append(
-                "CREATIVE DIRECTIVE (highest priority — all content must realize this vision):\n"
-                + genome.desired_outcome
-            )
-        if ref_description:
-            usage = genome.reference_image_usage or "style"
-            usage_labels = {
-                "style": "Match the reference image's visual style and aesthetic",
-                "composition": "Follow the reference image's composition and framing",
-                "mood": "Capture the reference image's emotional tone and atmosphere",
-                "recreate": "Closely recreate the reference image's overall look",
-            }
-            cm_parts.append(
-                f"REFERENCE IMAGE DIRECTION ({usage_labels.get(usage, usage_labels['style'])}):\n"
-                + ref_description
-            )
-        canvas_memory_directive = "\n\n".join(cm_parts)
-
         results: List[tuple[Graph, Dict[str, str]]] = []
         for i, hook_spec in enumerate(hook_specs):
             try:
@@ -513,7 +561,8 @@ Analyze this brief and return the Content Genome as JSON."""
                 hook_name = f"{experiment_name} — {' · '.join(label_parts)}"
 
                 graph = self._build_graph_from_steps(steps, hook_name)
-                graph.canvas_memory = canvas_memory_directive
+                if canvas_memory_directive:
+                    graph.canvas_memory = canvas_memory_directive
                 results.append((graph, genome_label))
             except Exception as exc:
                 logger.error("Failed to build graph for hook %d: %s", i, exc)
@@ -531,7 +580,7 @@ Analyze this brief and return the Content Genome as JSON."""
         artifact_type: str,
         image_model: str,
         video_model: str,
-        ref_description: str = "",
+        creative_directive_text: str = "",
         images_per_hook: int | None = None,
     ) -> List[Dict]:
         """Call the LLM Graph Architect and return parsed hook specifications."""
@@ -552,32 +601,6 @@ a dedicated reference image early in the pipeline to ensure visual consistency:
 
 {assets_text}"""
 
-        creative_sections: list[str] = []
-        if genome.desired_outcome:
-            creative_sections.append(
-                "## Creative Directive — Desired Outcome\n\n"
-                "The client has specified exactly what they want the final creative to look and feel like:\n\n"
-                f"> {genome.desired_outcome}\n\n"
-                "This is the NORTH STAR for every pipeline you design. Your terminal node's prompt must\n"
-                "describe this exact outcome. Every upstream prompt-writer node must craft prompts that\n"
-                "build toward realizing this specific vision. Do not deviate."
-            )
-        if ref_description:
-            usage = genome.reference_image_usage or "style"
-            usage_map = {
-                "style": "Match the visual style, color grading, lighting approach, and aesthetic of the reference image. The subject matter may differ, but the look and feel must be consistent.",
-                "composition": "Follow the composition, framing, camera angle, and spatial arrangement of the reference image. Adapt subject matter but preserve compositional structure.",
-                "mood": "Capture the emotional tone, atmosphere, and feeling of the reference image. Visuals may differ but must evoke the same emotional response.",
-                "recreate": "Closely recreate the reference image with the brief's subject matter. Match composition, style, lighting, color palette, and mood as closely as possible.",
-            }
-            creative_sections.append(
-                "## Reference Image Analysis\n\n"
-                f"The client provided a reference image (usage: **{usage}**).\n\n"
-                f"Detailed analysis:\n{ref_description}\n\n"
-                f"Instruction: {usage_map.get(usage, usage_map['style'])}\n\n"
-                "Incorporate this reference direction into every prompt-writer node's instructions."
-            )
-        creative_directive_text = "\n\n".join(creative_sections)
 
         if artifact_type == ArtifactType.IMAGE:
             if images_per_hook is not None and images_per_hook > 1:
@@ -641,9 +664,10 @@ Design {count} distinct creative pipeline hooks. Each hook should:
 6. Use branching where it makes creative sense
 """
 
-        # Select medium-specific architect prompt
-        medium_prompt = _IMAGE_ARCHITECT_PROMPT if artifact_type == ArtifactType.IMAGE else _VIDEO_ARCHITECT_PROMPT
-        system_prompt = f"{_GRAPH_ARCHITECT_BASE_PROMPT}\n\n{medium_prompt}"
+        # Select medium-specific architect prompt (static, so it goes first)
+        system_prompt = _ARCHITECT_SYSTEM_PROMPTS.get(
+            artifact_type, _ARCHITECT_SYSTEM_PROMPTS[ArtifactType.VIDEO]
+        )
 
         # Build prompt with creative directive inserted between genome and final sections
         prompt_parts = [system_prompt, brief_section, genome_section]
@@ -664,8 +688,8 @@ Design {count} distinct creative pipeline hooks. Each hook should:
 
         logger.debug("Graph Architect LLM response: %s", response[:500])
         try:
-            data = json.loads(response)
-        except (json.JSONDecodeError, TypeError) as exc:
+            data = orjson.loads(response)
+        except (orjson.JSONDecodeError, TypeError) as exc:
             logger.error("Failed to parse Graph Architect JSON: %s\nRaw: %s", exc, response)
             raise ValueError(f"AI returned invalid JSON for graph designs: {exc}") from exc
 
@@ -761,7 +785,7 @@ Design {count} distinct creative pipeline hooks. Each hook should:
                     to_node_id=to_node_id,
                     to_port_id=to_port.id,
                 )
-                graph.edges.append(edge)
+                graph.add_edge(edge, validate=False)
 
         return graph
 
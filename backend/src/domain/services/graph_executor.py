@@ -90,13 +90,7 @@ class GraphExecutor:
                         node_outputs[node_id] = result
                         yield self._event(
                             context, "node_completed", node_id=node_id,
-                            data={
-                                "media_type": result.media_type.value,
-                                "urls": {
-                                    "original": result.urls.original,
-                                    "thumbnail": result.urls.thumbnail,
-                                },
-                            },
+                            data={"media_type": result.media_type, "urls": result.urls},
                         )
 
                 if has_failure:
@@ -119,12 +113,11 @@ class GraphExecutor:
         node_id: Optional[str] = None,
         data: Optional[Dict] = None,
     ) -> ExecutionEvent:
-        event = ExecutionEvent(
+        # Events are streamed to the client, not retained on the context
+        return ExecutionEvent(
             execution_id=context.execution_id,
             event_type=event_type,
             timestamp=int(time.time()),
             node_id=node_id,
             data=data,
         )
-        context.events.append(event)
-        return event
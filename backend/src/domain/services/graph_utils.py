@@ -33,14 +33,14 @@ def get_required_nodes(graph: Graph, output_node_ids: List[str]) -> Set[str]:
     """Walk backwards from output nodes to find all nodes that need to execute."""
     required: Set[str] = set()
     stack = list(output_node_ids)
+    dependency_index = graph.dependency_index()
 
     while stack:
         nid = stack.pop()
         if nid in required:
             continue
         required.add(nid)
-        for dep_id in graph.get_dependencies(nid):
-            stack.append(dep_id)
+        stack.extend(dependency_index.get(nid, ()))
 
     return required
 
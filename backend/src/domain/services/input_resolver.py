@@ -1,11 +1,16 @@
 """Resolves upstream node data for a node's input ports."""
 
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
 from ..models.graph import Graph
 from ..models.media import MediaResult, MediaType
 from ..ports import StoragePort
 
+# Upstream media kept per run for fan-out, bounded by count and total size
+_MEDIA_CACHE_MAX_ENTRIES = 8
+_MEDIA_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 
 class InputResolver:
     """Resolves a node's input data from its upstream node results."""
@@ -14,12 +19,21 @@ class InputResolver:
         self._storage = storage
 
     async def resolve(
-        self, graph: Graph, node_id: str, node_results: Dict[str, MediaResult]
+        self,
+        graph: Graph,
+        node_id: str,
+        node_results: Dict[str, MediaResult],
+        media_cache: Optional[OrderedDict[str, bytes]] = None,
     ) -> Dict[str, List[Any]]:
         """Collect data from ALL upstream nodes connected to this node's input ports.
 
         Multiple edges can connect to the same port. Same-type inputs are collected
         as lists so executors can use all of them (e.g. multiple images -> text node).
+
+        ``media_cache`` (URL -> bytes) is owned by the caller for one run, so a
+        producer feeding several children is read from storage once. It is an
+        LRU bounded by count and total size, so large batches don't keep every
+        upstream buffer alive.
         """
         input_data: Dict[str, List[Any]] = {}
         node = graph.get_node(node_id)
@@ -38,15 +52,15 @@ class InputResolver:
                     continue
 
                 if source_result.media_type == MediaType.IMAGE:
-                    data = await self._read_result_bytes(source_result)
+                    data = await self._read_result_bytes(source_result, media_cache)
                     if data:
                         input_data.setdefault("images", []).append(data)
                 elif source_result.media_type == MediaType.VIDEO:
-                    data = await self._read_result_bytes(source_result)
+                    data = await self._read_result_bytes(source_result, media_cache)
                     if data:
                         input_data.setdefault("videos", []).append(data)
                 elif source_result.media_type == MediaType.AUDIO:
-                    data = await self._read_result_bytes(source_result)
+                    data = await self._read_result_bytes(source_result, media_cache)
                     if data:
                         input_data.setdefault("audios", []).append(data)
                 else:
@@ -56,6 +70,29 @@ class InputResolver:
 
         return input_data
 
-    async def _read_result_bytes(self, result: MediaResult) -> Optional[bytes]:
+    async def _read_result_bytes(
+        self, result: MediaResult, media_cache: Optional[OrderedDict[str, bytes]],
+    ) -> Optional[bytes]:
         """Read the original media file bytes via the storage port."""
-        return await self._storage.read_media_bytes(result.urls.original)
+        url = result.urls.original
+        if media_cache is None:
+            return await self._storage.read_media_bytes(url)
+
+        data = media_cache.get(url)
+        if data is not None:
+            media_cache.move_to_end(url)
+            return data
+
+        data = await self._storage.read_media_bytes(url)
+        if data is None or len(data) > _MEDIA_CACHE_MAX_BYTES:
+            return data
+
+        media_cache[url] = data
+        total = sum(map(len, media_cache.values()))
+        while (
+            len(media_cache) > _MEDIA_CACHE_MAX_ENTRIES
+            or total > _MEDIA_CACHE_MAX_BYTES
+        ):
+            _, evicted = media_cache.popitem(last=False)
+            total -= len(evicted)
+        return data
@@ -1,12 +1,15 @@
-import json
 import logging
 import time
 from pathlib import Path
 from typing import List, Optional
 
+import orjson
+
 from ..core.config import Settings
+from ..core.utils.ttl_cache import TTLCache
 from ..domain.models.experiment import Experiment
 from ..domain.ports import ExperimentRepositoryPort
+from .json_files import dump_json, write_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +20,8 @@ class JsonExperimentRepository(ExperimentRepositoryPort):
     def __init__(self, settings: Settings):
         self._dir = Path(settings.STORAGE_PATH) / "experiments"
         self._dir.mkdir(parents=True, exist_ok=True)
+        # Encoded JSON of recently saved/loaded experiments (see JsonGraphRepository)
+        self._cache: TTLCache[bytes] = TTLCache(maxsize=128, ttl=60.0)
 
     def _path(self, experiment_id: str) -> Path:
         return self._dir / f"{experiment_id}.json"
@@ -24,16 +29,22 @@ class JsonExperimentRepository(ExperimentRepositoryPort):
     async def save(self, experiment: Experiment) -> None:
         experiment.updated_at = time.time()
         data = experiment.to_dict()
-        self._path(experiment.id).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        raw = dump_json(data)
+        write_atomic(self._path(experiment.id), raw)
+        self._cache.set(experiment.id, raw)
 
     async def load(self, experiment_id: str) -> Optional[Experiment]:
-        path = self._path(experiment_id)
-        if not path.exists():
-            return None
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return Experiment.from_dict(data)
+        raw = self._cache.get(experiment_id)
+        if raw is None:
+            path = self._path(experiment_id)
+            if not path.exists():
+                return None
+            raw = path.read_bytes()
+            self._cache.set(experiment_id, raw)
+        return Experiment.from_dict(orjson.loads(raw))
 
     async def delete(self, experiment_id: str) -> None:
+        self._cache.pop(experiment_id)
         path = self._path(experiment_id)
         if path.exists():
             path.unlink()
@@ -41,6 +52,6 @@ class JsonExperimentRepository(ExperimentRepositoryPort):
     async def list_all(self) -> List[Experiment]:
         experiments = []
         for path in sorted(self._dir.glob("*.json")):
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = orjson.loads(path.read_bytes())
             experiments.append(Experiment.from_dict(data))
         return experiments
@@ -0,0 +1,32 @@
+"""JSON encoding and atomic file writes shared by the JSON repositories."""
+
+import os
+from pathlib import Path
+from typing import Any, Iterable, Tuple
+
+import orjson
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.tmp")
+
+
+def dump_json(data: Any) -> bytes:
+    """Encode a to_dict() payload; indented so files stay readable on disk."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file + os.replace so readers never see a partial file."""
+    write_all_atomic([(path, data)])
+
+
+def write_all_atomic(files: Iterable[Tuple[Path, bytes]]) -> None:
+    """Write every temp file first, then swap them all into place in one batch."""
+    staged = []
+    for path, data in files:
+        tmp = _tmp_path(path)
+        tmp.write_bytes(data)
+        staged.append((tmp, path))
+    for tmp, path in staged:
+        os.replace(tmp, path)
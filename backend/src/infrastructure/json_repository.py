@@ -1,12 +1,15 @@
-import json
 import logging
 import time
 from pathlib import Path
 from typing import List, Optional
 
+import orjson
+
 from ..core.config import Settings
+from ..core.utils.ttl_cache import TTLCache
 from ..domain.models.graph import Graph
 from ..domain.ports import GraphRepositoryPort
+from .json_files import dump_json, write_all_atomic, write_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +20,9 @@ class JsonGraphRepository(GraphRepositoryPort):
     def __init__(self, settings: Settings):
         self._dir = Path(settings.STORAGE_PATH) / "graphs"
         self._dir.mkdir(parents=True, exist_ok=True)
+        # Encoded JSON of recently saved/loaded graphs, so repeat loads skip
+        # the disk read. Bytes (not Graph objects) keeps every load independent.
+        self._cache: TTLCache[bytes] = TTLCache(maxsize=128, ttl=60.0)
 
     def _path(self, graph_id: str) -> Path:
         return self._dir / f"{graph_id}.json"
@@ -24,16 +30,33 @@ class JsonGraphRepository(GraphRepositoryPort):
     async def save(self, graph: Graph) -> None:
         graph.updated_at = time.time()
         data = graph.to_dict()
-        self._path(graph.id).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        raw = dump_json(data)
+        write_atomic(self._path(graph.id), raw)
+        self._cache.set(graph.id, raw)
+
+    async def save_many(self, graphs: List[Graph]) -> None:
+        """Save several graphs in one pass: serialize everything, then swap files in."""
+        now = time.time()
+        payloads = []
+        for graph in graphs:
+            graph.updated_at = now
+            payloads.append((graph.id, dump_json(graph.to_dict())))
+        write_all_atomic((self._path(graph_id), raw) for graph_id, raw in payloads)
+        for graph_id, raw in payloads:
+            self._cache.set(graph_id, raw)
 
     async def load(self, graph_id: str) -> Optional[Graph]:
-        path = self._path(graph_id)
-        if not path.exists():
-            return None
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return Graph.from_dict(data)
+        raw = self._cache.get(graph_id)
+        if raw is None:
+            path = self._path(graph_id)
+            if not path.exists():
+                return None
+            raw = path.read_bytes()
+            self._cache.set(graph_id, raw)
+        return Graph.from_dict(orjson.loads(raw))
 
     async def delete(self, graph_id: str) -> None:
+        self._cache.pop(graph_id)
         path = self._path(graph_id)
         if path.exists():
             path.unlink()
@@ -41,6 +64,6 @@ class JsonGraphRepository(GraphRepositoryPort):
     async def list_all(self) -> List[Graph]:
         graphs = []
         for path in sorted(self._dir.glob("*.json")):
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = orjson.loads(path.read_bytes())
             graphs.append(Graph.from_dict(data))
         return graphs
@@ -0,0 +1,74 @@
+from functools import lru_cache
+from pathlib import PurePath
+from typing import Any, Optional, Sequence
+
+import msgpack
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+# Naive datetimes are treated as UTC and written as RFC 3339 with a "Z" suffix.
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def orjson_default(obj: Any) -> Any:
+    """Fallback for types orjson does not encode natively (Enum/UUID/datetime are native)."""
+    if isinstance(obj, PurePath):
+        return obj.__fspath__()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=orjson_default, option=ORJSON_OPTIONS)
+
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+class MsgpackResponse(Response):
+    """Binary MessagePack response for clients that ask for it via Accept."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True, datetime=True)
+
+
+def accepts_msgpack(request: Optional[Request]) -> bool:
+    return request is not None and MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+@lru_cache()
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def dto_response(dto: BaseModel) -> Response:
+    """Serialize a DTO in a single pydantic-core pass.
+
+    Returning a ready-made Response skips FastAPI's jsonable_encoder walk and
+    response_model re-validation, so routes using this helper declare their
+    schema via ``responses={200: {"model": ...}}`` instead.
+    """
+    return Response(content=dto.model_dump_json(), media_type="application/json")
+
+
+def dto_list_response(model: type[BaseModel], dtos: Sequence[BaseModel]) -> Response:
+    """List counterpart of dto_response."""
+    return Response(content=_list_adapter(model).dump_json(dtos), media_type="application/json")
+
+
+def graph_dto_response(dto: BaseModel, request: Optional[Request] = None) -> Response:
+    """dto_response that switches to MessagePack when the client accepts it."""
+    if accepts_msgpack(request):
+        return MsgpackResponse(dto.model_dump())
+    return dto_response(dto)
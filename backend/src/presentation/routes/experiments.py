@@ -1,7 +1,6 @@
 import asyncio
 
 from fastapi import APIRouter, Depends, File, UploadFile
-from fastapi.responses import JSONResponse
 from typing import List
 
 from ...application.dto.experiment_mappers import experiment_to_dto
@@ -12,49 +11,51 @@ from ...application.dto.experiment_requests import (
     UpdateExperimentConfigRequest,
     UpdateGenomeRequest,
     UpdateHookStatusRequest,
+    UpdateHookStatusesRequest,
 )
 from ...application.dto.experiment_responses import ExperimentDTO
 from ...application.use_cases.experiment_operations import ExperimentOperations
 from ...di import get_experiment_operations
+from ..responses import ORJSONResponse, dto_list_response, dto_response
 
 router = APIRouter(prefix="/api/experiments", tags=["experiments"])
 
 
-@router.post("/", response_model=ExperimentDTO)
+@router.post("/", responses={200: {"model": ExperimentDTO}})
 async def create_experiment(
     request: CreateExperimentRequest,
     ops: ExperimentOperations = Depends(get_experiment_operations),
 ):
     experiment = await ops.create_experiment(request.name, request.brief)
-    return experiment_to_dto(experiment)
+    return dto_response(experiment_to_dto(experiment))
 
 
-@router.get("/", response_model=List[ExperimentDTO])
+@router.get("/", responses={200: {"model": List[ExperimentDTO]}})
 async def list_experiments(ops: ExperimentOperations = Depends(get_experiment_operations)):
     experiments = await ops.list_experiments()
-    return [experiment_to_dto(e) for e in experiments]
+    return dto_list_response(ExperimentDTO, [experiment_to_dto(e) for e in experiments])
 
 
-@router.get("/{experiment_id}", response_model=ExperimentDTO)
+@router.get("/{experiment_id}", responses={200: {"model": ExperimentDTO}})
 async def get_experiment(
     experiment_id: str,
     ops: ExperimentOperations = Depends(get_experiment_operations),
 ):
     experiment = await ops.get_experiment(experiment_id)
-    return experiment_to_dto(experiment)
+    return dto_response(experiment_to_dto(experiment))
 
 
-@router.post("/{experiment_id}/genome", response_model=ExperimentDTO)
+@router.post("/{experiment_id}/genome", responses={200: {"model": ExperimentDTO}})
 async def generate_genome(
     experiment_id: str,
     request: GenerateGenomeRequest = GenerateGenomeRequest(),
     ops: ExperimentOperations = Depends(get_experiment_operations),
 ):
     experiment = await ops.generate_genome(experiment_id, brief=request.brief)
-    return experiment_to_dto(experiment)
+    return dto_response(experiment_to_dto(experiment))
 
 
-@router.put("/{experiment_id}/genome", response_model=ExperimentDTO)
+@router.put("/{experiment_id}/genome", responses={200: {"model": ExperimentDTO}})
 async def update_genome(
     experiment_id: str,
     request: UpdateGenomeRequest,
@@ -72,10 +73,10 @@ async def update_genome(
         "required_assets": request.required_assets or [],
     }
     experiment = await ops.update_genome(experiment_id, genome_data)
-    return experiment_to_dto(experiment)
+    return dto_response(experiment_to_dto(experiment))
 
 
-@router.patch("/{experiment_id}/config", response_model=ExperimentDTO)
+@router.patch("/{experiment_id}/config", responses={200: {"model": ExperimentDTO}})
 async def update_experiment_config(
     experiment_id: str,
     request: UpdateExperimentConfigRequest,
@@ -88,7 +89,7 @@ async def update_experiment_config(
         video_model=request.video_model,
         images_per_hook=request.images_per_hook,
     )
-    return experiment_to_dto(experiment)
+    return dto_response(experiment_to_dto(experiment))
 
 
 @router.post("/{experiment_id}/reference-image")
@@ -102,7 +103,7 @@ async def upload_reference_image(
     return {"url": url}
 
 
-@router.post("/{experiment_id}/build", response_model=ExperimentDTO)
+@router.post("/{experiment_id}/build", responses={200: {"model": ExperimentDTO}})
 async def build_hooks(
     experiment_id: str,
     request: BuildHooksRequest = BuildHooksRequest(),
@@ -110,9 +111,9 @@ async def build_hooks(
 ):
     try:
         experiment = await ops.build_hooks(experiment_id, request.count)
-        return experiment_to_dto(experiment)
+        return dto_response(experiment_to_dto(experiment))
     except asyncio.CancelledError:
-        return JSONResponse(status_code=499, content={"message": "Build cancelled"})
+        return ORJSONResponse(status_code=499, content={"message": "Build cancelled"})
 
 
 @router.delete("/{experiment_id}/build")
@@ -124,7 +125,7 @@ async def cancel_build(
     return {"message": "Build cancelled"}
 
 
-@router.patch("/{experiment_id}/hooks/{hook_id}", response_model=ExperimentDTO)
+@router.patch("/{experiment_id}/hooks/{hook_id}", responses={200: {"model": ExperimentDTO}})
 async def update_hook_status(
     experiment_id: str,
     hook_id: str,
@@ -134,25 +135,35 @@ async def update_hook_status(
     experiment = await ops.update_hook_status(
         experiment_id, hook_id, request.status
     )
-    return experiment_to_dto(experiment)
+    return dto_response(experiment_to_dto(experiment))
 
 
-@router.post("/{experiment_id}/select-all", response_model=ExperimentDTO)
+@router.patch("/{experiment_id}/hooks", responses={200: {"model": ExperimentDTO}})
+async def update_hook_statuses(
+    experiment_id: str,
+    request: UpdateHookStatusesRequest,
+    ops: ExperimentOperations = Depends(get_experiment_operations),
+):
+    experiment = await ops.update_hook_statuses(experiment_id, request.changes)
+    return dto_response(experiment_to_dto(experiment))
+
+
+@router.post("/{experiment_id}/select-all", responses={200: {"model": ExperimentDTO}})
 async def select_all_hooks(
     experiment_id: str,
     ops: ExperimentOperations = Depends(get_experiment_operations),
 ):
     experiment = await ops.select_all_hooks(experiment_id)
-    return experiment_to_dto(experiment)
+    return dto_response(experiment_to_dto(experiment))
 
 
-@router.post("/{experiment_id}/deselect-all", response_model=ExperimentDTO)
+@router.post("/{experiment_id}/deselect-all", responses={200: {"model": ExperimentDTO}})
 async def deselect_all_hooks(
     experiment_id: str,
     ops: ExperimentOperations = Depends(get_experiment_operations),
 ):
     experiment = await ops.deselect_all_hooks(experiment_id)
-    return experiment_to_dto(experiment)
+    return dto_response(experiment_to_dto(experiment))
 
 
 @router.delete("/{experiment_id}")
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from typing import List
 
 from ...application.dto.mappers import edge_to_dto, graph_to_dto
@@ -7,41 +7,54 @@ from ...application.dto.responses import EdgeDTO, GraphDTO
 from ...application.use_cases.edge_operations import EdgeOperations
 from ...application.use_cases.graph_operations import GraphOperations
 from ...di import get_edge_operations, get_graph_operations
+from ..responses import (
+    MSGPACK_MEDIA_TYPE,
+    dto_list_response,
+    dto_response,
+    graph_dto_response,
+)
 
 router = APIRouter(prefix="/api/graphs", tags=["graphs"])
 
 
 # -- Routes --
 
-@router.post("/", response_model=GraphDTO)
+@router.post("/", responses={200: {"model": GraphDTO}})
 async def create_graph(
     request: CreateGraphRequest,
     ops: GraphOperations = Depends(get_graph_operations),
 ):
     graph = await ops.create_graph(request.name)
-    return graph_to_dto(graph)
+    return dto_response(graph_to_dto(graph))
 
 
-@router.get("/", response_model=List[GraphDTO])
+@router.get("/", responses={200: {"model": List[GraphDTO]}})
 async def list_graphs(ops: GraphOperations = Depends(get_graph_operations)):
     graphs = await ops.list_graphs()
-    return [graph_to_dto(g) for g in graphs]
+    return dto_list_response(GraphDTO, [graph_to_dto(g) for g in graphs])
 
 
-@router.get("/{graph_id}", response_model=GraphDTO)
-async def get_graph(graph_id: str, ops: GraphOperations = Depends(get_graph_operations)):
+@router.get(
+    "/{graph_id}",
+    responses={200: {"model": GraphDTO, "content": {MSGPACK_MEDIA_TYPE: {}}}},
+)
+async def get_graph(
+    graph_id: str,
+    request: Request,
+    ops: GraphOperations = Depends(get_graph_operations),
+):
     graph = await ops.get_graph(graph_id)
-    return graph_to_dto(graph)
+    return graph_dto_response(graph_to_dto(graph), request)
 
 
-@router.patch("/{graph_id}", response_model=GraphDTO)
+@router.patch("/{graph_id}", responses={200: {"model": GraphDTO}})
 async def update_graph(
     graph_id: str,
     request: UpdateGraphRequest,
     ops: GraphOperations = Depends(get_graph_operations),
 ):
     graph = await ops.update_graph(graph_id, name=request.name, canvas_memory=request.canvas_memory)
-    return graph_to_dto(graph)
+    return dto_response(graph_to_dto(graph))
 
 
 @router.delete("/{graph_id}")
@@ -50,15 +63,15 @@ async def delete_graph(graph_id: str, ops: GraphOperations = Depends(get_graph_o
     return {"message": "Graph deleted"}
 
 
-@router.post("/{graph_id}/duplicate", response_model=GraphDTO)
+@router.post("/{graph_id}/duplicate", responses={200: {"model": GraphDTO}})
 async def duplicate_graph(graph_id: str, ops: GraphOperations = Depends(get_graph_operations)):
     graph = await ops.duplicate_graph(graph_id)
-    return graph_to_dto(graph)
+    return dto_response(graph_to_dto(graph))
 
 
 # -- Edge endpoints (nested under graph) --
 
-@router.post("/{graph_id}/edges", response_model=EdgeDTO)
+@router.post("/{graph_id}/edges", responses={200: {"model": EdgeDTO}})
 async def create_edge(
     graph_id: str,
     request: CreateEdgeRequest,
@@ -68,7 +81,7 @@ async def create_edge(
         graph_id, request.from_node_id, request.from_port_id,
         request.to_node_id, request.to_port_id,
     )
-    return edge_to_dto(edge)
+    return dto_response(edge_to_dto(edge))
 
 
 @router.delete("/{graph_id}/edges/{edge_id}")
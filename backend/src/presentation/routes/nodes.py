@@ -5,11 +5,12 @@ from ...application.dto.requests import CreateNodeRequest, UpdateNodeRequest
 from ...application.dto.responses import NodeDTO
 from ...application.use_cases.node_operations import NodeOperations
 from ...di import get_node_operations
+from ..responses import dto_response
 
 router = APIRouter(prefix="/api/graphs/{graph_id}/nodes", tags=["nodes"])
 
 
-@router.post("/", response_model=NodeDTO)
+@router.post("/", responses={200: {"model": NodeDTO}})
 async def create_node(
     graph_id: str,
     request: CreateNodeRequest,
@@ -23,10 +24,10 @@ async def create_node(
         position=(request.position.x, request.position.y),
         provider=request.provider,
     )
-    return node_to_dto(node)
+    return dto_response(node_to_dto(node))
 
 
-@router.patch("/{node_id}", response_model=NodeDTO)
+@router.patch("/{node_id}", responses={200: {"model": NodeDTO}})
 async def update_node(
     graph_id: str,
     node_id: str,
@@ -42,7 +43,7 @@ async def update_node(
         updates["label"] = request.label
 
     node = await ops.update_node(graph_id, node_id, updates)
-    return node_to_dto(node)
+    return dto_response(node_to_dto(node))
 
 
 @router.delete("/{node_id}")
@@ -55,7 +56,7 @@ async def delete_node(
     return {"message": "Node deleted"}
 
 
-@router.post("/{node_id}/regenerate", response_model=NodeDTO)
+@router.post("/{node_id}/regenerate", responses={200: {"model": NodeDTO}})
 async def regenerate_node(
     graph_id: str,
     node_id: str,
@@ -63,4 +64,4 @@ async def regenerate_node(
     ops: NodeOperations = Depends(get_node_operations),
 ):
     node = await ops.regenerate_node(graph_id, node_id, create_variant)
-    return node_to_dto(node)
+    return dto_response(node_to_dto(node))
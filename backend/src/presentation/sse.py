@@ -1,19 +1,21 @@
 import asyncio
-import json
 from collections.abc import AsyncGenerator
 from typing import Any
 
+import orjson
 from fastapi.responses import StreamingResponse
 
+from .responses import ORJSON_OPTIONS, orjson_default
+
 
 async def sse_stream(
-    event_source: AsyncGenerator[dict[str, Any], None],
+    event_source: AsyncGenerator[Any, None],
     sleep_interval: float = 0.05,
 ) -> StreamingResponse:
     async def event_generator():
+        # Events are dicts or dataclasses; orjson serializes both directly
         async for event in event_source:
-            data = json.dumps(event)
-            yield f"data: {data}\n\n"
+            yield b"data: " + orjson.dumps(event, default=orjson_default, option=ORJSON_OPTIONS) + b"\n\n"
             await asyncio.sleep(sleep_interval)
 
     return StreamingResponse(
@@ -0,0 +1,194 @@
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Set
+
+from src.domain.models.batch_execution import (
+    BatchContext,
+    GraphOutcome,
+    NodeTypeConfig,
+    SchedulableNode,
+)
+from src.domain.models.graph import Edge, Graph, Node, NodeStatus, NodeType, Position
+from src.domain.models.media import MediaMetadata, MediaResult, MediaType, MediaUrls
+from src.domain.services import input_resolver
+from src.domain.services.batch_scheduler import BatchScheduler
+from src.domain.services.input_resolver import InputResolver
+
+_TEXT = NodeType.GENERATE_TEXT
+
+
+class FakeExecutor:
+    """Records start order; nodes in ``fail`` raise, nodes in ``gates`` wait for their event."""
+
+    def __init__(
+        self,
+        fail: Set[str] = frozenset(),
+        gates: Dict[str, asyncio.Event] | None = None,
+        media_type: MediaType = MediaType.TEXT,
+    ):
+        self.fail = fail
+        self.gates = gates or {}
+        self.media_type = media_type
+        self.started: List[str] = []
+
+    async def execute(self, node: Node, input_data: dict, canvas_memory: str = "") -> MediaResult:
+        self.started.append(node.id)
+        await asyncio.sleep(0)
+        if node.id in self.gates:
+            await self.gates[node.id].wait()
+        if node.id in self.fail:
+            raise RuntimeError(f"boom {node.id}")
+        return MediaResult(
+            id=f"r-{node.id}", timestamp=1, media_type=self.media_type,
+            urls=MediaUrls(original=f"media/{node.id}", thumbnail="t"), prompt="p",
+            metadata=MediaMetadata(),
+        )
+
+
+class FakeResolver:
+    async def resolve(self, graph, node_id, node_results, media_cache=None):
+        return {}
+
+
+class CountingStorage:
+    """Storage stub for InputResolver that counts media reads per URL."""
+
+    def __init__(self):
+        self.reads: Dict[str, int] = {}
+
+    async def read_media_bytes(self, url: str) -> bytes:
+        self.reads[url] = self.reads.get(url, 0) + 1
+        return url.encode()
+
+
+def _nodes(graph_id: str, deps: Dict[str, Set[str]]) -> List[SchedulableNode]:
+    graph = Graph(id=graph_id, name=graph_id)
+    nodes = []
+    for node_id, node_deps in deps.items():
+        node = Node(id=node_id, type=_TEXT, label=node_id, params={}, position=Position(0, 0))
+        graph.add_node(node)
+        for dep_id in node_deps:
+            graph.add_edge(
+                Edge.from_ports(dep_id, dep_id + "_output_text", node_id, node_id + "_input_in"),
+                validate=False,
+            )
+        nodes.append(SchedulableNode(
+            node_id=node_id, graph_id=graph_id, node_type=_TEXT,
+            dependencies=set(node_deps), node=node, graph=graph,
+        ))
+    return nodes
+
+
+async def _run(scheduler: BatchScheduler, nodes: List[SchedulableNode], context: BatchContext):
+    async def collect():
+        return [event async for event in scheduler.execute(nodes, context)]
+    return await asyncio.wait_for(collect(), 2)
+
+
+async def test_ready_nodes_launch_longest_critical_path_first():
+    # One slot for the type, so start order is launch order. When R finishes,
+    # H (chain of 2) is launched ahead of the leaf L even though L is listed first.
+    nodes = _nodes("g", {"R": set(), "L": {"R"}, "H": {"R"}, "H2": {"H"}})
+    executor = FakeExecutor()
+    scheduler = BatchScheduler(
+        executor, FakeResolver(), {_TEXT: NodeTypeConfig(max_concurrency=1)},
+    )
+    context = BatchContext(batch_id="b", experiment_id="e", graph_ids=["g"])
+
+    await _run(scheduler, nodes, context)
+
+    assert executor.started == ["R", "H", "L", "H2"]
+    assert context.graph_outcomes["g"] == GraphOutcome.COMPLETED
+
+
+async def test_queued_nodes_are_ranked_by_critical_path():
+    # One worker, so start order is exactly queue order. After R finishes,
+    # H (chain of 3) beats the leaf L; H2 (chain of 2), promoted later, still
+    # overtakes the queued L; L then beats H3 because equal ranks stay FIFO.
+    nodes = _nodes("g", {
+        "R": set(), "L": {"R"}, "H": {"R"}, "H2": {"H"}, "H3": {"H2"},
+    })
+    executor = FakeExecutor()
+    scheduler = BatchScheduler(
+        executor, FakeResolver(), {_TEXT: NodeTypeConfig(max_concurrency=1)},
+    )
+    context = BatchContext(batch_id="b", experiment_id="e", graph_ids=["g"])
+
+    await _run(scheduler, nodes, context)
+
+    assert executor.started == ["R", "H", "H2", "L", "H3"]
+
+async def test_failed_graph_releases_pending_nodes_and_batch_finishes():
+    nodes = _nodes("bad", {"A": set(), "B": {"A"}, "C": {"B"}}) + _nodes("good", {"X": set(), "Y": {"X"}})
+    executor = FakeExecutor(fail={"A"})
+    scheduler = BatchScheduler(executor, FakeResolver())
+    context = BatchContext(batch_id="b", experiment_id="e", graph_ids=["bad", "good"])
+
+    events = await _run(scheduler, nodes, context)
+
+    assert "B" not in executor.started and "C" not in executor.started
+    assert context.graph_outcomes == {"bad": GraphOutcome.FAILED, "good": GraphOutcome.COMPLETED}
+    assert events[-1].event_type == "batch_completed"
+    by_node = {sn.node_id: sn.node.status for sn in nodes}
+    assert by_node["A"] == NodeStatus.FAILED
+    assert by_node["Y"] == NodeStatus.COMPLETED
+
+
+async def test_failure_waits_for_in_flight_sibling_before_finishing():
+    # S is already running when A fails: the batch must not end until S
+    # returns, and S's dependent T must never start.
+    release_s = asyncio.Event()
+    nodes = _nodes("g", {"A": set(), "S": set(), "T": {"S"}})
+    executor = FakeExecutor(fail={"A"}, gates={"S": release_s})
+    scheduler = BatchScheduler(executor, FakeResolver())
+    context = BatchContext(batch_id="b", experiment_id="e", graph_ids=["g"])
+
+    run = asyncio.create_task(_run(scheduler, nodes, context))
+    while context.graph_outcomes.get("g") != GraphOutcome.FAILED:
+        await asyncio.sleep(0)
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert not run.done()
+
+    release_s.set()
+    events = await run
+
+    assert "T" not in executor.started
+    assert [e.event_type for e in events].count("batch_completed") == 1
+    assert events[-1].event_type == "batch_completed"
+
+
+async def test_fan_out_reads_each_producer_once_per_batch():
+    nodes = _nodes("g", {"P": set(), "A": {"P"}, "B": {"P"}, "C": {"P"}})
+    storage = CountingStorage()
+    scheduler = BatchScheduler(FakeExecutor(media_type=MediaType.IMAGE), InputResolver(storage))
+    context = BatchContext(batch_id="b", experiment_id="e", graph_ids=["g"])
+
+    await _run(scheduler, nodes, context)
+
+    assert storage.reads == {"media/P": 1}
+
+
+async def test_media_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(input_resolver, "_MEDIA_CACHE_MAX_ENTRIES", 1)
+    graph = _nodes("g", {"P": set(), "Q": set(), "A": {"P"}, "B": {"Q"}})[0].graph
+    image = MediaType.IMAGE
+    results = {
+        node_id: MediaResult(
+            id=node_id, timestamp=1, media_type=image,
+            urls=MediaUrls(original=f"media/{node_id}", thumbnail="t"), prompt="p",
+            metadata=MediaMetadata(),
+        )
+        for node_id in ("P", "Q")
+    }
+    storage = CountingStorage()
+    resolver = InputResolver(storage)
+    cache = OrderedDict()
+
+    await resolver.resolve(graph, "A", results, cache)
+    await resolver.resolve(graph, "A", results, cache)
+    await resolver.resolve(graph, "B", results, cache)
+    await resolver.resolve(graph, "A", results, cache)
+
+    assert storage.reads == {"media/P": 2, "media/Q": 1}
+    assert list(cache) == ["media/P"]
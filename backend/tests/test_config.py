@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from src.core.config import _load_settings, _parse_bool, _parse_list
+
+
+@pytest.mark.parametrize("raw", ["1", "true", "True", " yes ", "on", "t", "Y"])
+def test_parse_bool_true_spellings(raw):
+    assert _parse_bool(raw) is True
+
+
+@pytest.mark.parametrize("raw", ["0", "false", "FALSE", "no", "off", "f", "n"])
+def test_parse_bool_false_spellings(raw):
+    assert _parse_bool(raw) is False
+
+
+@pytest.mark.parametrize("raw", ["", "2", "maybe", "enabled"])
+def test_parse_bool_rejects_unknown_values(raw):
+    with pytest.raises(ValueError):
+        _parse_bool(raw)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ('["http://a", "http://b"]', ["http://a", "http://b"]),
+        ("http://a, http://b,", ["http://a", "http://b"]),
+        ("http://a", ["http://a"]),
+        ("[]", []),
+    ],
+)
+def test_parse_list_accepts_json_arrays_and_comma_separated(raw, expected):
+    assert _parse_list(raw) == expected
+
+
+def test_environment_overrides_dotenv(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("PORT=9000\nlog_level=DEBUG\nCORS_ORIGINS=[\"http://x\"]\n")
+    monkeypatch.setenv("PORT", "9100")
+
+    settings = _load_settings(str(env_file))
+
+    assert settings.PORT == 9100
+    assert settings.LOG_LEVEL == "DEBUG"
+    assert settings.CORS_ORIGINS == ["http://x"]
+
+
+def test_dotenv_values_do_not_leak_into_environment(tmp_path, monkeypatch):
+    monkeypatch.delenv("BASE_URL", raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text("BASE_URL=http://example\n")
+
+    assert _load_settings(str(env_file)).BASE_URL == "http://example"
+    assert "BASE_URL" not in os.environ
+
+
+def test_invalid_value_names_the_setting(tmp_path, monkeypatch):
+    monkeypatch.setenv("ENRICHMENT_ENABLED", "maybe")
+
+    with pytest.raises(ValueError, match="ENRICHMENT_ENABLED"):
+        _load_settings(str(tmp_path / "missing.env"))
@@ -0,0 +1,49 @@
+import asyncio
+
+from src.core.utils.event_channel import EventChannel
+
+
+async def _drain(channel: EventChannel) -> list:
+    return [event async for event in channel]
+
+
+async def test_yields_pushed_events_in_order_then_stops_on_close():
+    channel: EventChannel[int] = EventChannel()
+    for i in range(3):
+        channel.push(i)
+    channel.close()
+
+    assert await _drain(channel) == [0, 1, 2]
+
+
+async def test_events_pushed_before_close_are_drained():
+    channel: EventChannel[str] = EventChannel()
+    consumer = asyncio.create_task(_drain(channel))
+    await asyncio.sleep(0)
+
+    channel.push("a")
+    channel.push("b")
+    channel.close()
+    channel.push("after close")
+
+    assert await asyncio.wait_for(consumer, 1) == ["a", "b"]
+
+
+async def test_consumer_waits_for_producer():
+    channel: EventChannel[int] = EventChannel()
+    consumer = asyncio.create_task(_drain(channel))
+
+    for i in range(3):
+        await asyncio.sleep(0)
+        assert not consumer.done()
+        channel.push(i)
+    channel.close()
+
+    assert await asyncio.wait_for(consumer, 1) == [0, 1, 2]
+
+
+async def test_close_with_no_events_ends_stream():
+    channel: EventChannel[int] = EventChannel()
+    channel.close()
+
+    assert await asyncio.wait_for(_drain(channel), 1) == []
@@ -0,0 +1,47 @@
+from src.domain.models.graph import Edge, Graph, Node, NodeType, Position
+
+
+def _graph(edges: list[tuple[str, str]], extra: tuple[str, ...] = ()) -> Graph:
+    graph = Graph(id="g", name="g")
+    node_ids = dict.fromkeys([nid for edge in edges for nid in edge] + list(extra))
+    for node_id in node_ids:
+        graph.add_node(Node(
+            id=node_id, type=NodeType.GENERATE_TEXT, label=node_id,
+            params={}, position=Position(0, 0),
+        ))
+    for from_id, to_id in edges:
+        graph.add_edge(Edge.from_ports(
+            from_id, from_id + "_output_text", to_id, to_id + "_input_in",
+        ))
+    return graph
+
+
+def _stale(graph: Graph) -> set[str]:
+    return {node_id for node_id, node in graph.nodes.items() if node.stale}
+
+
+def test_mark_stale_many_marks_every_seed_and_its_downstream():
+    graph = _graph([("A", "B"), ("B", "C"), ("D", "E")], extra=("F",))
+
+    graph.mark_stale_many(["A", "D"])
+
+    assert _stale(graph) == {"A", "B", "C", "D", "E"}
+
+
+def test_mark_stale_many_matches_repeated_mark_stale():
+    edges = [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"), ("E", "D"), ("D", "F")]
+    bulk, single = _graph(edges, extra=("G",)), _graph(edges, extra=("G",))
+
+    bulk.mark_stale_many(["C", "B", "C"])
+    single.mark_stale("C")
+    single.mark_stale("B")
+
+    assert _stale(bulk) == _stale(single) == {"B", "C", "D", "F"}
+
+
+def test_mark_stale_many_ignores_unknown_ids():
+    graph = _graph([("A", "B")])
+
+    graph.mark_stale_many(["missing", "B"])
+
+    assert _stale(graph) == {"B"}
@@ -0,0 +1,26 @@
+import re
+
+from src.core.utils.id_generator import generate_id, generate_ids
+
+_ID_PATTERN = re.compile(r"[0-9a-f]{12}")
+
+
+def test_generate_id_format():
+    assert _ID_PATTERN.fullmatch(generate_id())
+
+
+def test_generate_ids_length_and_format():
+    ids = generate_ids(50)
+
+    assert len(ids) == 50
+    assert all(_ID_PATTERN.fullmatch(i) for i in ids)
+
+
+def test_generate_ids_are_unique():
+    ids = generate_ids(10_000)
+
+    assert len(set(ids)) == len(ids)
+
+
+def test_generate_ids_zero():
+    assert generate_ids(0) == []
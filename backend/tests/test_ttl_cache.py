@@ -0,0 +1,65 @@
+import pytest
+
+from src.core.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_get_returns_value_before_expiry(clock):
+    cache: TTLCache[str] = TTLCache(ttl=10, clock=clock)
+    cache.set("a", "x")
+    clock.now += 9.9
+
+    assert cache.get("a") == "x"
+
+
+def test_entry_expires_after_ttl(clock):
+    cache: TTLCache[str] = TTLCache(ttl=10, clock=clock)
+    cache.set("a", "x")
+    clock.now += 10.1
+
+    assert cache.get("a") is None
+    # Expired entries are removed, not just hidden
+    assert "a" not in cache._entries
+
+
+def test_set_refreshes_expiry(clock):
+    cache: TTLCache[str] = TTLCache(ttl=10, clock=clock)
+    cache.set("a", "x")
+    clock.now += 8
+    cache.set("a", "y")
+    clock.now += 8
+
+    assert cache.get("a") == "y"
+
+
+def test_evicts_least_recently_used_when_full(clock):
+    cache: TTLCache[int] = TTLCache(maxsize=2, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_pop_removes_entry_and_ignores_missing_keys(clock):
+    cache: TTLCache[int] = TTLCache(clock=clock)
+    cache.set("a", 1)
+    cache.pop("a")
+    cache.pop("missing")
+
+    assert cache.get("a") is None